@@ -7,10 +7,14 @@ import os
 import logging
 from flask import Flask
 from .routes import bp
-from .models import init_db
-from .logging_system import initialize_logging, get_logging_system, LogCategory
+from .models import init_db, get_category_counts
+from .logging_system import (
+    initialize_logging, get_logging_system, LogCategory,
+    begin_metrics_batch, flush_metrics_batch
+)
 from .error_handler import get_error_handler
 from .config_manager import ConfigManager
+from .json_provider import OrjsonJSONProvider
 
 def setup_application_logging():
     """Setup application-wide logging and error handling"""
@@ -114,6 +118,9 @@ def create_app():
                     template_folder=template_dir,
                     static_folder=static_dir)
         
+        # JSONレスポンスは orjson で生成する（未インストールの場合は標準の json）
+        app.json = OrjsonJSONProvider(app)
+        
         # Store configuration manager in app context for access by routes
         app.config_manager = config_manager
         app.config_valid = config_valid
@@ -124,12 +131,18 @@ def create_app():
             app.logger.addHandler(logger.handlers[0] if logger.handlers else logging.StreamHandler())
             app.logger.setLevel(logging.INFO)
         
+        # performance_monitor の計測値はリクエスト終了時にまとめて記録する
+        app.before_request(begin_metrics_batch)
+        app.teardown_request(lambda exc: flush_metrics_batch())
+        
         app.register_blueprint(bp)
         
         # データベース初期化 with error handling
         try:
             init_db()
             logger.info("Database initialization completed")
+            # カテゴリごとの件数を起動時に集計しておき、最初のページ表示で集計しないようにする
+            get_category_counts(config_manager)
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
             if logging_success:
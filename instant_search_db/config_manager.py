@@ -1,8 +1,9 @@
 import json
 import os
 import logging
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+from datetime import datetime
 import jsonschema
 from jsonschema import validate, ValidationError
 
@@ -64,6 +65,10 @@ class ConfigManager:
         self._fields_cache: Optional[Dict[str, Any]] = None
         self._ui_cache: Optional[UIConfig] = None
         
+        # Plain-dict forms of the loaded configurations, paired with the object they were built from
+        self._categories_serialized: Optional[Tuple[Dict[str, CategoryConfig], Dict[str, Dict[str, Any]]]] = None
+        self._ui_serialized: Optional[Tuple[UIConfig, Dict[str, Any]]] = None
+        
         # Error handler for comprehensive error management
         self.error_handler = ErrorHandler(logger)
         
@@ -398,32 +403,63 @@ class ConfigManager:
         logger.info("Loaded UI configuration")
         return ui_config
     
-    def validate_all_configs(self) -> bool:
-        """Validate all configuration files"""
-        logger.info("Validating all configuration files...")
-        
-        all_valid = True
+    def get_categories_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the categories configuration as plain dictionaries
+        
+        The conversion is done once per loaded configuration and reused until
+        the categories are reloaded. The returned dictionary must not be modified.
+        """
+        categories = self.load_categories()
+        cached = self._categories_serialized
+        if cached is None or cached[0] is not categories:
+            cached = (categories, {key: asdict(category) for key, category in categories.items()})
+            self._categories_serialized = cached
+        return cached[1]
+    
+    def get_ui_settings_dict(self) -> Dict[str, Any]:
+        """
+        Get the UI settings as a plain dictionary
+        
+        The conversion is done once per loaded configuration and reused until
+        the UI settings are reloaded. The returned dictionary must not be modified.
+        """
+        ui_config = self.load_ui_settings()
+        cached = self._ui_serialized
+        if cached is None or cached[0] is not ui_config:
+            cached = (ui_config, asdict(ui_config))
+            self._ui_serialized = cached
+        return cached[1]
+    
+    def validate_detailed(self) -> Dict[str, Dict[str, str]]:
+        """
+        Validate all configuration files and report the result per section
         
-        # Validate categories
-        try:
-            self.load_categories(force_reload=True)
-        except Exception as e:
-            logger.error(f"Categories validation failed: {e}")
-            all_valid = False
+        Each file is reloaded once. The returned dictionary maps "categories",
+        "fields" and "ui" to {"status": "valid" | "error", "message": ...}.
+        """
+        logger.info("Validating all configuration files...")
         
-        # Validate fields
-        try:
-            self.load_field_mappings(force_reload=True)
-        except Exception as e:
-            logger.error(f"Fields validation failed: {e}")
-            all_valid = False
+        sections = (
+            ("categories", "Categories", self.load_categories, "カテゴリ設定"),
+            ("fields", "Fields", self.load_field_mappings, "フィールド設定"),
+            ("ui", "UI", self.load_ui_settings, "UI設定"),
+        )
+        details = {}
+        for key, label, load, display_name in sections:
+            try:
+                load(force_reload=True)
+                details[key] = {"status": "valid", "message": f"{display_name}は有効です"}
+            except Exception as e:
+                logger.error(f"{label} validation failed: {e}")
+                details[key] = {"status": "error", "message": f"{display_name}エラー: {str(e)}"}
         
-        # Validate UI
-        try:
-            self.load_ui_settings(force_reload=True)
-        except Exception as e:
-            logger.error(f"UI validation failed: {e}")
-            all_valid = False
+        return details
+    
+    def validate_all_configs(self) -> bool:
+        """Validate all configuration files"""
+        details = self.validate_detailed()
+        all_valid = all(detail["status"] == "valid" for detail in details.values())
         
         if all_valid:
             logger.info("All configurations are valid")
@@ -496,7 +532,7 @@ class ConfigManager:
         """Perform comprehensive health check of configuration system"""
         health_status = {
             "overall_status": "healthy",
-            "timestamp": get_logging_system().performance_metrics[-1].timestamp.isoformat() if get_logging_system().performance_metrics else None,
+            "timestamp": datetime.fromtimestamp(get_logging_system().performance_metrics[-1].timestamp).isoformat() if get_logging_system().performance_metrics else None,
             "checks": {}
         }
         
@@ -7,6 +7,7 @@ import os
 import json
 import shutil
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
@@ -1359,26 +1360,41 @@ class DataManager:
         Returns:
             List of backup metadata dictionaries
         """
-        backups = []
-        
         if not self.backup_dir.exists():
-            return backups
+            return []
         
         # Find all metadata files
-        for metadata_file in self.backup_dir.glob("*_metadata.json"):
-            try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                backups.append(metadata)
-            except (json.JSONDecodeError, IOError):
-                # Skip invalid metadata files
-                continue
+        with os.scandir(self.backup_dir) as entries:
+            metadata_paths = [
+                entry.path for entry in entries
+                if entry.name.endswith("_metadata.json") and entry.is_file()
+            ]
+        
+        # Read metadata files concurrently so slow (e.g. network) filesystems
+        # overlap their I/O waits
+        if len(metadata_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(metadata_paths))) as executor:
+                loaded = list(executor.map(self._load_backup_metadata, metadata_paths))
+        else:
+            loaded = [self._load_backup_metadata(path) for path in metadata_paths]
+        
+        backups = [metadata for metadata in loaded if metadata is not None]
         
         # Sort by creation date (newest first)
         backups.sort(key=lambda x: x.get('created_at', ''), reverse=True)
         
         return backups
     
+    @staticmethod
+    def _load_backup_metadata(metadata_path: str) -> Optional[Dict[str, Any]]:
+        """Load a single backup metadata file, returning None if it is invalid."""
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            # Skip invalid metadata files
+            return None
+    
     def restore_backup(self, backup_path: str, target_path: str) -> bool:
         """
         Restore a backup to a target location.
@@ -4,8 +4,48 @@ Provides flexible Item model with custom field support.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import functools
 import json
+import string
+
+
+_STANDARD_TEXT_FIELDS = ('category', 'name', 'description')
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_display_format(fmt: str) -> Tuple[Callable[..., str], Tuple[str, ...]]:
+    """
+    Parse a display format string once and cache the result.
+    
+    Args:
+        fmt: Format string such as "{category} {name}"
+        
+    Returns:
+        Tuple of the bound ``fmt.format`` method and the field names it references
+        
+    Raises:
+        ValueError: If the format string is malformed
+    """
+    referenced = []
+    _collect_format_fields(fmt, referenced)
+    return fmt.format, tuple(referenced)
+
+
+def _collect_format_fields(fmt: str, referenced: List[str]):
+    """
+    Append the top-level field names used by a format string to referenced.
+    
+    Format specs are parsed too, so the width in "{name:{width}}" is found.
+    """
+    for _, field_name, format_spec, _ in string.Formatter().parse(fmt):
+        if field_name:
+            # "{price.amount}" / "{tags[0]}" only need the top-level name
+            root = field_name.split('.', 1)[0].split('[', 1)[0]
+            if root and root not in referenced:
+                referenced.append(root)
+        if format_spec:
+            _collect_format_fields(format_spec, referenced)
 
 
 @dataclass
@@ -34,14 +74,15 @@ class Item:
         """
         if field_config and 'display_format' in field_config:
             # Use configured display format
-            format_str = field_config['display_format']
             try:
-                return format_str.format(
-                    category=self.category,
-                    name=self.name,
-                    description=self.description,
-                    **self.custom_fields
-                )
+                formatter, referenced = _compile_display_format(field_config['display_format'])
+                values = {}
+                for field_name in referenced:
+                    if field_name in _STANDARD_TEXT_FIELDS:
+                        values[field_name] = getattr(self, field_name)
+                    else:
+                        values[field_name] = self.custom_fields[field_name]
+                return formatter(**values)
             except (KeyError, ValueError):
                 # Fallback to default format if formatting fails
                 pass
@@ -65,25 +106,33 @@ class Item:
             Combined search text string
         """
         if search_fields is None:
-            search_fields = ['category', 'name', 'description']
+            return ' '.join(filter(None, (self.category, self.name, self.description)))
         
-        search_parts = []
+        return ' '.join(filter(None, self._iter_search_values(search_fields)))
+    
+    def _iter_search_values(self, search_fields: List[str]):
+        """
+        Yield the text value of each requested search field.
         
-        # Add standard fields
+        Args:
+            search_fields: List of field names to include in search text
+            
+        Yields:
+            Field values as strings (empty values may be yielded and are
+            filtered out by the caller)
+        """
+        custom_fields = self.custom_fields
         for field_name in search_fields:
-            if field_name == 'category' and self.category:
-                search_parts.append(self.category)
-            elif field_name == 'name' and self.name:
-                search_parts.append(self.name)
-            elif field_name == 'description' and self.description:
-                search_parts.append(self.description)
-            elif field_name in self.custom_fields:
+            if field_name in _STANDARD_TEXT_FIELDS:
+                value = getattr(self, field_name)
+                if value:
+                    yield value
+                    continue
+            if field_name in custom_fields:
                 # Add custom field value
-                value = self.custom_fields[field_name]
+                value = custom_fields[field_name]
                 if value is not None:
-                    search_parts.append(str(value))
-        
-        return ' '.join(search_parts)
+                    yield str(value)
     
     def to_dict(self, include_custom_fields: bool = True) -> Dict[str, Any]:
         """
@@ -3,17 +3,28 @@ Enhanced error handling system for the instant search database application.
 Provides comprehensive error handling, user-friendly messages, and recovery suggestions.
 """
 
+import functools
 import logging
 import traceback
 import sys
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass
+import time
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 from datetime import datetime
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are also plain strings"""
+        
+        def __str__(self) -> str:
+            return self.value
 
-class ErrorSeverity(Enum):
+
+class ErrorSeverity(StrEnum):
     """Error severity levels"""
     LOW = "low"
     MEDIUM = "medium"
@@ -21,7 +32,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-class ErrorCategory(Enum):
+class ErrorCategory(StrEnum):
     """Error categories for better classification"""
     CONFIGURATION = "configuration"
     DATA_VALIDATION = "data_validation"
@@ -64,8 +75,65 @@ class ErrorInfo:
     technical_details: str
     context: ErrorContext
     recovery_actions: List[RecoveryAction]
-    timestamp: datetime
+    timestamp: float  # Epoch seconds, as returned by time.time()
     resolved: bool = False
+    # Plain-string copies of the enum values, read by the summary paths
+    severity_value: str = field(init=False, repr=False)
+    category_value: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.severity_value = str(self.severity)
+        self.category_value = str(self.category)
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp formatted as a local ISO 8601 string"""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
+
+_DEFAULT_USER_MESSAGE = "予期しないエラーが発生しました。"
+
+
+@dataclass(frozen=True)
+class _PatternSpec:
+    """Pre-built handling strategy for a known error pattern"""
+    category: ErrorCategory
+    severity: ErrorSeverity
+    user_message: str
+    recovery_actions: Tuple[RecoveryAction, ...] = ()
+    
+    @classmethod
+    def from_config(cls, pattern_info: Dict[str, Any]) -> '_PatternSpec':
+        """
+        Build a pattern spec from a pattern configuration dictionary.
+        
+        Args:
+            pattern_info: Dictionary with category, severity, user_message
+                and recovery_actions keys
+            
+        Returns:
+            _PatternSpec instance
+        """
+        return cls(
+            category=pattern_info.get('category', ErrorCategory.SYSTEM),
+            severity=pattern_info.get('severity', ErrorSeverity.MEDIUM),
+            user_message=pattern_info.get('user_message', _DEFAULT_USER_MESSAGE),
+            recovery_actions=tuple(
+                RecoveryAction(
+                    action_type=config.get('action_type', 'unknown'),
+                    description=config.get('description', ''),
+                    automated=config.get('automated', False)
+                )
+                for config in pattern_info.get('recovery_actions', [])
+            )
+        )
+
+
+_DEFAULT_PATTERN_SPEC = _PatternSpec(
+    category=ErrorCategory.SYSTEM,
+    severity=ErrorSeverity.MEDIUM,
+    user_message=_DEFAULT_USER_MESSAGE
+)
 
 
 class ErrorHandler:
@@ -85,9 +153,9 @@ class ErrorHandler:
         self.error_patterns = self._initialize_error_patterns()
         self.recovery_callbacks: Dict[str, Callable] = {}
         
-    def _initialize_error_patterns(self) -> Dict[str, Dict[str, Any]]:
+    def _initialize_error_patterns(self) -> Dict[str, _PatternSpec]:
         """Initialize common error patterns and their handling strategies"""
-        return {
+        patterns = {
             "config_file_not_found": {
                 "category": ErrorCategory.CONFIGURATION,
                 "severity": ErrorSeverity.MEDIUM,
@@ -203,6 +271,8 @@ class ErrorHandler:
                 ]
             }
         }
+        
+        return {name: _PatternSpec.from_config(info) for name, info in patterns.items()}
     
     def handle_error(self, 
                     exception: Exception, 
@@ -220,26 +290,30 @@ class ErrorHandler:
             ErrorInfo object with comprehensive error details
         """
         # Generate unique error ID
-        error_id = f"ERR_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{id(exception)}"
+        timestamp = time.time()
+        error_id = f"ERR_{time.strftime('%Y%m%d_%H%M%S', time.localtime(timestamp))}_{id(exception)}"
         
         # Determine error pattern if not provided
         if not error_pattern:
             error_pattern = self._detect_error_pattern(exception)
         
         # Get pattern information
-        pattern_info = self.error_patterns.get(error_pattern, {})
+        spec = self.error_patterns.get(error_pattern, _DEFAULT_PATTERN_SPEC)
+        if not isinstance(spec, _PatternSpec):
+            # Pattern registered directly as a configuration dictionary
+            spec = _PatternSpec.from_config(spec)
         
         # Create error info
         error_info = ErrorInfo(
             error_id=error_id,
-            category=pattern_info.get('category', ErrorCategory.SYSTEM),
-            severity=pattern_info.get('severity', ErrorSeverity.MEDIUM),
+            category=spec.category,
+            severity=spec.severity,
             message=str(exception),
-            user_message=pattern_info.get('user_message', "予期しないエラーが発生しました。"),
+            user_message=spec.user_message,
             technical_details=self._get_technical_details(exception),
             context=context or ErrorContext(),
-            recovery_actions=self._create_recovery_actions(pattern_info.get('recovery_actions', [])),
-            timestamp=datetime.now()
+            recovery_actions=self._create_recovery_actions(spec.recovery_actions),
+            timestamp=timestamp
         )
         
         # Store error in registry
@@ -314,27 +388,26 @@ class ErrorHandler:
         
         return json.dumps(details, indent=2, ensure_ascii=False)
     
-    def _create_recovery_actions(self, action_configs: List[Dict[str, Any]]) -> List[RecoveryAction]:
+    def _create_recovery_actions(self, templates: Tuple[RecoveryAction, ...]) -> List[RecoveryAction]:
         """
-        Create recovery action objects from configuration.
+        Create recovery action objects bound to the registered callbacks.
         
         Args:
-            action_configs: List of action configuration dictionaries
+            templates: Recovery actions from a pattern spec (without callbacks)
             
         Returns:
             List of RecoveryAction objects
         """
-        actions = []
-        for config in action_configs:
-            action = RecoveryAction(
-                action_type=config.get('action_type', 'unknown'),
-                description=config.get('description', ''),
-                automated=config.get('automated', False),
-                callback=self.recovery_callbacks.get(config.get('action_type'))
+        callbacks = self.recovery_callbacks
+        return [
+            RecoveryAction(
+                action_type=template.action_type,
+                description=template.description,
+                automated=template.automated,
+                callback=callbacks.get(template.action_type)
             )
-            actions.append(action)
-        
-        return actions
+            for template in templates
+        ]
     
     def _log_error(self, error_info: ErrorInfo) -> None:
         """
@@ -395,8 +468,8 @@ class ErrorHandler:
         category_counts = {}
         
         for error in self.error_registry.values():
-            severity_counts[error.severity.value] = severity_counts.get(error.severity.value, 0) + 1
-            category_counts[error.category.value] = category_counts.get(error.category.value, 0) + 1
+            severity_counts[error.severity_value] = severity_counts.get(error.severity_value, 0) + 1
+            category_counts[error.category_value] = category_counts.get(error.category_value, 0) + 1
         
         return {
             "total_errors": total_errors,
@@ -407,10 +480,10 @@ class ErrorHandler:
             "recent_errors": [
                 {
                     "error_id": error.error_id,
-                    "category": error.category.value,
-                    "severity": error.severity.value,
+                    "category": error.category_value,
+                    "severity": error.severity_value,
                     "message": error.user_message,
-                    "timestamp": error.timestamp.isoformat()
+                    "timestamp": error.timestamp_iso
                 }
                 for error in sorted(self.error_registry.values(), 
                                   key=lambda x: x.timestamp, reverse=True)[:10]
@@ -451,9 +524,9 @@ class ErrorHandler:
         return {
             "error_id": error.error_id,
             "message": error.user_message,
-            "severity": error.severity.value,
-            "category": error.category.value,
-            "timestamp": error.timestamp.isoformat(),
+            "severity": error.severity_value,
+            "category": error.category_value,
+            "timestamp": error.timestamp_iso,
             "recovery_suggestions": [
                 {
                     "description": action.description,
@@ -465,8 +538,8 @@ class ErrorHandler:
         }
 
 
-# Global error handler instance
-_global_error_handler: Optional[ErrorHandler] = None
+# Global error handler instance (created eagerly so lookups never branch)
+_global_error_handler: ErrorHandler = ErrorHandler()
 
 
 def get_error_handler() -> ErrorHandler:
@@ -476,9 +549,6 @@ def get_error_handler() -> ErrorHandler:
     Returns:
         Global ErrorHandler instance
     """
-    global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = ErrorHandler()
     return _global_error_handler
 
 
@@ -512,19 +582,22 @@ def graceful_degradation(fallback_func: Callable,
         Decorator function
     """
     def decorator(func: Callable):
+        error_handler = get_error_handler()
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                error_handler = get_error_handler()
+                # The call arguments are kept in the error registry with the error
                 context = ErrorContext(
                     function_name=func.__name__,
                     additional_data={"args": str(args), "kwargs": str(kwargs)}
                 )
-                error_info = error_handler.handle_error(e, context)
+                error_handler.handle_error(e, context)
                 
                 # Log graceful degradation
-                error_handler.logger.warning(f"Graceful degradation: {error_message}")
+                error_handler.logger.warning("Graceful degradation: %s", error_message)
                 
                 # Execute fallback
                 try:
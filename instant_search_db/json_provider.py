@@ -0,0 +1,46 @@
+"""
+JSON provider for the Flask application.
+Serializes JSON responses with orjson when it is installed.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to Flask's default provider
+    orjson = None
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that builds ``jsonify`` responses with orjson.
+    
+    Only response bodies are produced by orjson. ``dumps``/``loads`` (and
+    therefore the ``tojson`` template filter) keep the default behaviour.
+    Dates are passed through to Flask's ``default`` so they are still
+    rendered as HTTP dates, and ``sort_keys`` is honoured. orjson always
+    writes non-ASCII text as UTF-8, so ``ensure_ascii`` defaults to False
+    here. The provider falls back to the standard library when orjson is
+    unavailable, ``ensure_ascii`` is set, pretty output is requested (debug
+    mode) or a value cannot be encoded by orjson.
+    """
+    
+    ensure_ascii = False
+    
+    def response(self, *args: Any, **kwargs: Any):
+        if (orjson is None or self.ensure_ascii
+                or (self.compact is None and self._app.debug) or self.compact is False):
+            return super().response(*args, **kwargs)
+        
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -3,19 +3,43 @@ Comprehensive logging system for the instant search database application.
 Provides structured logging, performance monitoring, and debug capabilities.
 """
 
+import base64
 import logging
 import logging.handlers
 import os
+import queue
+import sys
 import json
 import time
 import functools
-from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+import weakref
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Callable, Deque, NamedTuple, Tuple
+from datetime import date, datetime, timedelta
 from enum import Enum
 import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for binary log output
+    msgpack = None
+
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are also plain strings"""
+        
+        def __str__(self) -> str:
+            return self.value
+
 
 class LogLevel(Enum):
     """Custom log levels for application-specific logging"""
@@ -25,7 +49,7 @@ class LogLevel(Enum):
     USER_ACTION = 28
 
 
-class LogCategory(Enum):
+class LogCategory(StrEnum):
     """Log categories for better organization"""
     SYSTEM = "system"
     CONFIGURATION = "configuration"
@@ -38,60 +62,345 @@ class LogCategory(Enum):
     SECURITY = "security"
 
 
-@dataclass
-class PerformanceMetric:
+class PerformanceMetric(NamedTuple):
     """Performance metric data structure"""
     operation: str
     duration: float
-    timestamp: datetime
+    timestamp: float  # time.time() epoch seconds
     category: LogCategory
     additional_data: Optional[Dict[str, Any]] = None
     success: bool = True
 
 
-@dataclass
-class ConfigurationChange:
+class ConfigurationChange(NamedTuple):
     """Configuration change tracking"""
     config_type: str
     old_value: Any
     new_value: Any
-    timestamp: datetime
+    timestamp: float  # time.time() epoch seconds
     user: Optional[str] = None
     source: Optional[str] = None
 
 
+# Logger used for each log category (see LoggingSystem._setup_loggers)
+_CATEGORY_TO_LOGGER_NAME: Dict[LogCategory, str] = {
+    LogCategory.SYSTEM: 'main',
+    LogCategory.CONFIGURATION: 'config',
+    LogCategory.DATA_MANAGEMENT: 'main',
+    LogCategory.SEARCH: 'main',
+    LogCategory.VALIDATION: 'validation',
+    LogCategory.PERFORMANCE: 'performance',
+    LogCategory.USER_INTERACTION: 'user',
+    LogCategory.ERROR_HANDLING: 'error',
+    LogCategory.SECURITY: 'main'
+}
+
+# Loggers that echo warnings and errors to the console
+_CONSOLE_LOGGER_NAMES = frozenset({'main', 'error'})
+
+# Handlers installed on each logger by the LoggingSystem that currently owns
+# it {logger name: [handler, ...]}; a newer system replaces them
+_installed_handlers: Dict[str, List[logging.Handler]] = {}
+
+# deque.append() and list(deque) are atomic while the GIL is held, so the
+# metric buffers only need explicit locking on free-threaded builds
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def _snapshot(buffer: Deque, lock: threading.Lock) -> list:
+    """
+    Copy a metric buffer so readers can work on it without blocking writers.
+    
+    Args:
+        buffer: Deque to copy
+        lock: Lock guarding the deque on free-threaded builds
+        
+    Returns:
+        List with the current contents of the buffer
+    """
+    if _GIL_ENABLED:
+        return list(buffer)
+    with lock:
+        return list(buffer)
+
+
+# Optional LogRecord attributes copied into structured log entries
+_EXTRA_KEYS = ('category', 'user_id', 'operation', 'duration', 'additional_data')
+
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging"""
     
+    # (whole second, formatted prefix) of the most recently formatted record
+    _timestamp_cache = (None, '')
+    
+    def _format_timestamp(self, created: float, msecs: float) -> str:
+        """Format a record creation time as a local ISO 8601 string"""
+        second = int(created)
+        cached_second, prefix = self._timestamp_cache
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(created))
+            self._timestamp_cache = (second, prefix)
+        return f"{prefix}.{int(msecs):03d}"
+    
     def format(self, record):
-        # Create structured log entry
+        d = record.__dict__
+        site = _log_site_json(d['levelname'], d['name'], d['module'], d['funcName'], d['lineno'])
+        # Splice the cached call-site members in front of the per-record ones
+        return '{' + site + ',' + _dumps_log_entry(self._build_record_fields(record))[1:]
+    
+    def _build_log_entry(self, record) -> Dict[str, Any]:
+        """Collect the fields of a record into a structured log entry"""
+        d = record.__dict__
+        log_entry = _log_site_fields(d['levelname'], d['name'], d['module'], d['funcName'], d['lineno'])
+        log_entry.update(self._build_record_fields(record))
+        return log_entry
+    
+    def _build_record_fields(self, record) -> Dict[str, Any]:
+        """Collect the fields that change from one record to the next"""
+        d = record.__dict__
+        
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
+            "timestamp": self._format_timestamp(d['created'], d['msecs']),
+            "message": record.getMessage()
         }
         
         # Add extra fields if present
-        if hasattr(record, 'category'):
-            log_entry['category'] = record.category
-        if hasattr(record, 'user_id'):
-            log_entry['user_id'] = record.user_id
-        if hasattr(record, 'operation'):
-            log_entry['operation'] = record.operation
-        if hasattr(record, 'duration'):
-            log_entry['duration'] = record.duration
-        if hasattr(record, 'additional_data'):
-            log_entry['additional_data'] = record.additional_data
+        for key in _EXTRA_KEYS:
+            value = d.get(key)
+            if value is not None:
+                log_entry[key] = value
         
         # Add exception info if present
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
         
-        return json.dumps(log_entry, ensure_ascii=False, default=str)
+        return log_entry
+
+
+class BinaryStructuredFormatter(StructuredFormatter):
+    """
+    Structured formatter that encodes log entries with MessagePack.
+    
+    Each entry is packed with msgpack and base64-encoded so it can still be
+    written one record per line by the text-mode file handlers. Requires
+    the optional msgpack package.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        if msgpack is None:
+            raise ImportError("BinaryStructuredFormatter requires the msgpack package")
+        super().__init__(*args, **kwargs)
+    
+    def format(self, record):
+        packed = msgpack.packb(self._build_log_entry(record), default=str)
+        return base64.b64encode(packed).decode('ascii')
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the JSON encoders do not support natively"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode('ascii')
+    # Path and anything else are written as their string form
+    return str(obj)
+
+
+class _LogEntryEncoder(json.JSONEncoder):
+    """Standard library JSON encoder used when orjson is unavailable"""
+    
+    def default(self, o):
+        return _json_default(o)
+
+
+# Compact separators match orjson's output
+_JSON_ENCODER = _LogEntryEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps_log_entry(log_entry: Dict[str, Any]) -> str:
+    """
+    Serialize a structured log entry to a JSON string.
+    
+    Uses orjson when it is installed and falls back to the standard library
+    for values orjson cannot encode (e.g. integers wider than 64 bits).
+    
+    Args:
+        log_entry: Log entry dictionary
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                log_entry, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            pass
+    return _JSON_ENCODER.encode(log_entry)
+
+
+def _log_site_fields(level: str, logger: str, module: str,
+                     function: str, line: int) -> Dict[str, Any]:
+    """Structured log fields that are fixed for a given log call site"""
+    return {
+        "level": level,
+        "logger": logger,
+        "module": module,
+        "function": function,
+        "line": line
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _log_site_json(level: str, logger: str, module: str,
+                   function: str, line: int) -> str:
+    """
+    Encode the call-site fields once as JSON object members (without the
+    surrounding braces) so StructuredFormatter can reuse them per record.
+    """
+    return _dumps_log_entry(_log_site_fields(level, logger, module, function, line))[1:-1]
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large buffer and flushes
+    only for warnings and above or after every ``flush_interval`` records.
+    """
+    
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
+                 encoding=None, delay=False,
+                 buffer_size: int = 64 * 1024, flush_interval: int = 100):
+        # Set before the base class opens the stream via _open()
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._pending_records = 0
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending_records += 1
+            if (record.levelno >= logging.WARNING
+                    or self._pending_records >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        super().flush()
+        self._pending_records = 0
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to an in-process listener thread"""
+    
+    def prepare(self, record):
+        # Merge the arguments into the message now, so mutable arguments cannot
+        # change before the listener formats the record. exc_info is kept
+        # intact for StructuredFormatter since the record never leaves the
+        # process.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _LoggerRoutingHandler(logging.Handler):
+    """Dispatches queued records to the file handler of their source logger"""
+    
+    def __init__(self, routes: Dict[str, logging.Handler]):
+        super().__init__()
+        self.routes = routes
+    
+    def handle(self, record):
+        handler = self.routes.get(record.name)
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+        return True
+    
+    def flush(self):
+        for handler in self.routes.values():
+            handler.flush()
+
+
+class _BatchingQueueListener:
+    """
+    Background thread that drains queued records in batches and flushes its
+    handler once per batch, so a burst of records reaches each log file
+    in a single write while an idle queue leaves nothing buffered.
+    """
+    
+    max_batch = 256
+    _sentinel = object()
+    
+    def __init__(self, log_queue: queue.SimpleQueue, handler: logging.Handler):
+        self.queue = log_queue
+        self.handler = handler
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start the writer thread"""
+        self._thread = threading.Thread(target=self._run, name="log-queue-listener", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Write the records queued so far and wait for the thread to exit"""
+        if self._thread is None:
+            return
+        self.queue.put(self._sentinel)
+        self._thread.join()
+        self._thread = None
+    
+    def _run(self):
+        sentinel = self._sentinel
+        while True:
+            record = self.queue.get()
+            handled = 0
+            while record is not sentinel:
+                self.handler.handle(record)
+                handled += 1
+                if handled >= self.max_batch:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            self.handler.flush()
+            if record is sentinel:
+                break
+
+
+def _stop_queue_logging(listener: _BatchingQueueListener,
+                        attached_handlers: List[Tuple[logging.Logger, logging.Handler]]):
+    """
+    Detach the handlers a LoggingSystem added to its loggers, then let the
+    listener write what is already queued. Registered through
+    weakref.finalize so it also runs at interpreter exit without keeping
+    the LoggingSystem alive.
+    """
+    for logger, handler in attached_handlers:
+        logger.removeHandler(handler)
+        installed = _installed_handlers.get(logger.name)
+        if installed and handler in installed:
+            installed.remove(handler)
+    attached_handlers.clear()
+    listener.stop()
 
 
 class LoggingSystem:
@@ -104,7 +413,10 @@ class LoggingSystem:
                  log_dir: str = "logs",
                  app_name: str = "instant_search_db",
                  max_log_size: int = 10 * 1024 * 1024,  # 10MB
-                 backup_count: int = 5):
+                 backup_count: int = 5,
+                 binary_format: bool = False,
+                 enable_console: bool = True,
+                 console_level: int = logging.WARNING):
         """
         Initialize logging system.
         
@@ -113,26 +425,43 @@ class LoggingSystem:
             app_name: Application name for log files
             max_log_size: Maximum size of each log file in bytes
             backup_count: Number of backup log files to keep
+            binary_format: Write base64 MessagePack records instead of JSON
+                (requires msgpack)
+            enable_console: Echo warnings and errors of the main and error
+                loggers to the console
+            console_level: Minimum level written to the console
         """
         self.log_dir = Path(log_dir)
         self.app_name = app_name
         self.max_log_size = max_log_size
         self.backup_count = backup_count
+        self.binary_format = binary_format
+        self.enable_console = enable_console
+        self.console_level = console_level
         
         # Create log directory
         self.log_dir.mkdir(exist_ok=True)
         
-        # Performance metrics storage
-        self.performance_metrics: List[PerformanceMetric] = []
+        # Performance metrics storage (only the most recent 1000 are kept)
+        self.performance_metrics: Deque[PerformanceMetric] = deque(maxlen=1000)
         self.metrics_lock = threading.Lock()
         
-        # Configuration change tracking
-        self.config_changes: List[ConfigurationChange] = []
+        # Configuration change tracking (only the most recent 500 are kept)
+        self.config_changes: Deque[ConfigurationChange] = deque(maxlen=500)
         self.config_lock = threading.Lock()
         
+        # File writes happen on a background listener thread; loggers only
+        # enqueue records
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._file_handlers: Dict[str, logging.Handler] = {}
+        self._attached_handlers: List[Tuple[logging.Logger, logging.Handler]] = []
+        self._queue_listener: Optional[_BatchingQueueListener] = None
+        self._queue_finalizer: Optional[weakref.finalize] = None
+        
         # Initialize loggers
         self.loggers: Dict[str, logging.Logger] = {}
         self._setup_loggers()
+        self._start_queue_listener()
         
         # Add custom log levels
         self._add_custom_log_levels()
@@ -208,33 +537,74 @@ class LoggingSystem:
         """
         logger = logging.getLogger(f"{self.app_name}.{name}")
         logger.setLevel(level)
+        # Records are fully handled here; passing them on to the root logger
+        # would only format and write them a second time
+        logger.propagate = False
         
-        # Prevent duplicate handlers
-        if logger.handlers:
-            return logger
+        # Take the logger over from an earlier LoggingSystem (e.g. the one
+        # replaced by initialize_logging) instead of stacking duplicate handlers
+        for handler in _installed_handlers.pop(logger.name, ()):
+            logger.removeHandler(handler)
+        installed = _installed_handlers[logger.name] = []
         
-        # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Buffered file handler with rotation
+        file_handler = BufferedRotatingFileHandler(
             self.log_dir / filename,
             maxBytes=self.max_log_size,
             backupCount=self.backup_count,
             encoding='utf-8'
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(StructuredFormatter())
+        file_handler.setFormatter(
+            BinaryStructuredFormatter() if self.binary_format else StructuredFormatter()
+        )
         
-        # Console handler for errors and warnings
-        if level <= logging.WARNING:
+        # Console handler for errors and warnings; the category loggers only
+        # ever receive their own below-WARNING levels, so they skip it
+        if self.enable_console and name in _CONSOLE_LOGGER_NAMES:
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.WARNING)
+            console_handler.setLevel(max(level, self.console_level))
             console_handler.setFormatter(
                 logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             )
             logger.addHandler(console_handler)
+            installed.append(console_handler)
+            self._attached_handlers.append((logger, console_handler))
         
-        logger.addHandler(file_handler)
+        # Records are queued here and written by the listener thread
+        self._file_handlers[logger.name] = file_handler
+        queue_handler = _InProcessQueueHandler(self._log_queue)
+        logger.addHandler(queue_handler)
+        installed.append(queue_handler)
+        self._attached_handlers.append((logger, queue_handler))
         return logger
     
+    def _start_queue_listener(self):
+        """Start the background thread that writes queued records to the log files"""
+        if not self._file_handlers:
+            return
+        
+        self._queue_listener = _BatchingQueueListener(
+            self._log_queue,
+            _LoggerRoutingHandler(self._file_handlers)
+        )
+        self._queue_listener.start()
+        self._queue_finalizer = weakref.finalize(
+            self, _stop_queue_logging, self._queue_listener, self._attached_handlers
+        )
+    
+    def shutdown(self):
+        """
+        Detach this system's handlers from its loggers, flush queued log
+        records and stop the background writer thread.
+        """
+        if self._queue_finalizer is None:
+            return
+        
+        self._queue_finalizer()
+        self._queue_finalizer = None
+        self._queue_listener = None
+    
     def get_logger(self, category: LogCategory = LogCategory.SYSTEM) -> logging.Logger:
         """
         Get logger for specific category.
@@ -245,20 +615,7 @@ class LoggingSystem:
         Returns:
             Logger instance
         """
-        category_mapping = {
-            LogCategory.SYSTEM: 'main',
-            LogCategory.CONFIGURATION: 'config',
-            LogCategory.DATA_MANAGEMENT: 'main',
-            LogCategory.SEARCH: 'main',
-            LogCategory.VALIDATION: 'validation',
-            LogCategory.PERFORMANCE: 'performance',
-            LogCategory.USER_INTERACTION: 'user',
-            LogCategory.ERROR_HANDLING: 'error',
-            LogCategory.SECURITY: 'main'
-        }
-        
-        logger_name = category_mapping.get(category, 'main')
-        return self.loggers[logger_name]
+        return self.loggers[_CATEGORY_TO_LOGGER_NAME.get(category, 'main')]
     
     def log_performance(self, 
                        operation: str,
@@ -276,35 +633,46 @@ class LoggingSystem:
             additional_data: Additional data to log
             success: Whether the operation was successful
         """
-        metric = PerformanceMetric(
+        self.log_performance_batch([PerformanceMetric(
             operation=operation,
             duration=duration,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             category=category,
             additional_data=additional_data,
             success=success
-        )
+        )])
+    
+    def log_performance_batch(self, metrics: List[PerformanceMetric]):
+        """
+        Record several performance metrics at once.
         
-        with self.metrics_lock:
-            self.performance_metrics.append(metric)
-            
-            # Keep only recent metrics (last 1000)
-            if len(self.performance_metrics) > 1000:
-                self.performance_metrics = self.performance_metrics[-1000:]
+        Args:
+            metrics: Metrics to record, in the order they were measured
+        """
+        if _GIL_ENABLED:
+            self.performance_metrics.extend(metrics)
+        else:
+            with self.metrics_lock:
+                self.performance_metrics.extend(metrics)
         
         # Log to performance logger
         logger = self.get_logger(LogCategory.PERFORMANCE)
-        logger.log(
-            LogLevel.PERFORMANCE.value,
-            f"Performance: {operation}",
-            extra={
-                'category': category.value,
-                'operation': operation,
-                'duration': duration,
-                'success': success,
-                'additional_data': additional_data
-            }
-        )
+        level = LogLevel.PERFORMANCE.value
+        if not logger.isEnabledFor(level):
+            return
+        for metric in metrics:
+            logger.log(
+                level,
+                "Performance: %s",
+                metric.operation,
+                extra={
+                    'category': metric.category,
+                    'operation': metric.operation,
+                    'duration': metric.duration,
+                    'success': metric.success,
+                    'additional_data': metric.additional_data
+                }
+            )
     
     def log_configuration_change(self,
                                 config_type: str,
@@ -326,25 +694,28 @@ class LoggingSystem:
             config_type=config_type,
             old_value=old_value,
             new_value=new_value,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             user=user,
             source=source
         )
         
-        with self.config_lock:
+        if _GIL_ENABLED:
             self.config_changes.append(change)
-            
-            # Keep only recent changes (last 500)
-            if len(self.config_changes) > 500:
-                self.config_changes = self.config_changes[-500:]
+        else:
+            with self.config_lock:
+                self.config_changes.append(change)
         
         # Log to configuration logger
         logger = self.get_logger(LogCategory.CONFIGURATION)
+        level = LogLevel.CONFIGURATION.value
+        if not logger.isEnabledFor(level):
+            return
         logger.log(
-            LogLevel.CONFIGURATION.value,
-            f"Configuration changed: {config_type}",
+            level,
+            "Configuration changed: %s",
+            config_type,
             extra={
-                'category': LogCategory.CONFIGURATION.value,
+                'category': LogCategory.CONFIGURATION,
                 'config_type': config_type,
                 'old_value': str(old_value),
                 'new_value': str(new_value),
@@ -366,11 +737,15 @@ class LoggingSystem:
             additional_data: Additional data about the action
         """
         logger = self.get_logger(LogCategory.USER_INTERACTION)
+        level = LogLevel.USER_ACTION.value
+        if not logger.isEnabledFor(level):
+            return
         logger.log(
-            LogLevel.USER_ACTION.value,
-            f"User action: {action}",
+            level,
+            "User action: %s",
+            action,
             extra={
-                'category': LogCategory.USER_INTERACTION.value,
+                'category': LogCategory.USER_INTERACTION,
                 'user_id': user_id,
                 'action': action,
                 'additional_data': additional_data
@@ -390,11 +765,16 @@ class LoggingSystem:
             details: Additional validation details
         """
         logger = self.get_logger(LogCategory.VALIDATION)
+        level = LogLevel.DATA_VALIDATION.value
+        if not logger.isEnabledFor(level):
+            return
         logger.log(
-            LogLevel.DATA_VALIDATION.value,
-            f"Data validation: {validation_type} - {'PASSED' if result else 'FAILED'}",
+            level,
+            "Data validation: %s - %s",
+            validation_type,
+            'PASSED' if result else 'FAILED',
             extra={
-                'category': LogCategory.VALIDATION.value,
+                'category': LogCategory.VALIDATION,
                 'validation_type': validation_type,
                 'result': result,
                 'additional_data': details
@@ -412,46 +792,43 @@ class LoggingSystem:
         Returns:
             Performance summary dictionary
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_ts = (datetime.now() - timedelta(hours=hours)).timestamp()
         
-        with self.metrics_lock:
-            recent_metrics = [
-                m for m in self.performance_metrics 
-                if m.timestamp >= cutoff_time
-            ]
+        # Filtering and aggregation run on the copy, outside any lock
+        snapshot = _snapshot(self.performance_metrics, self.metrics_lock)
+        recent_metrics = [m for m in snapshot if m.timestamp >= cutoff_ts]
         
         if not recent_metrics:
             return {"message": "No performance data available"}
         
+        # Group durations and success counts by operation in a single pass;
+        # the per-operation aggregates are then computed by the builtins
+        durations_by_operation = defaultdict(list)
+        successes_by_operation = defaultdict(int)
+        for metric in recent_metrics:
+            durations_by_operation[metric.operation].append(metric.duration)
+            if metric.success:
+                successes_by_operation[metric.operation] += 1
+        
         # Calculate statistics
         total_operations = len(recent_metrics)
-        successful_operations = sum(1 for m in recent_metrics if m.success)
+        successful_operations = sum(successes_by_operation.values())
         failed_operations = total_operations - successful_operations
         
-        # Group by operation
         operation_stats = {}
-        for metric in recent_metrics:
-            if metric.operation not in operation_stats:
-                operation_stats[metric.operation] = {
-                    'count': 0,
-                    'total_duration': 0,
-                    'min_duration': float('inf'),
-                    'max_duration': 0,
-                    'success_count': 0
-                }
-            
-            stats = operation_stats[metric.operation]
-            stats['count'] += 1
-            stats['total_duration'] += metric.duration
-            stats['min_duration'] = min(stats['min_duration'], metric.duration)
-            stats['max_duration'] = max(stats['max_duration'], metric.duration)
-            if metric.success:
-                stats['success_count'] += 1
-        
-        # Calculate averages
-        for operation, stats in operation_stats.items():
-            stats['avg_duration'] = stats['total_duration'] / stats['count']
-            stats['success_rate'] = stats['success_count'] / stats['count']
+        for operation, durations in durations_by_operation.items():
+            count = len(durations)
+            total_duration = sum(durations)
+            success_count = successes_by_operation[operation]
+            operation_stats[operation] = {
+                'count': count,
+                'total_duration': total_duration,
+                'min_duration': min(durations),
+                'max_duration': max(durations),
+                'success_count': success_count,
+                'avg_duration': total_duration / count,
+                'success_rate': success_count / count
+            }
         
         return {
             "time_period_hours": hours,
@@ -476,18 +853,18 @@ class LoggingSystem:
         Returns:
             List of configuration changes
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        with self.config_lock:
-            changes = [
-                asdict(change) for change in self.config_changes
-                if change.timestamp >= cutoff_time and
-                (config_type is None or change.config_type == config_type)
-            ]
+        cutoff_ts = (datetime.now() - timedelta(hours=hours)).timestamp()
         
-        # Convert datetime objects to ISO strings
-        for change in changes:
-            change['timestamp'] = change['timestamp'].isoformat()
+        # Filtering and dict conversion run on the copy, outside any lock
+        snapshot = _snapshot(self.config_changes, self.config_lock)
+        changes = []
+        for change in snapshot:
+            if change.timestamp >= cutoff_ts and \
+               (config_type is None or change.config_type == config_type):
+                change_dict = change._asdict()
+                # Convert epoch timestamps to ISO strings
+                change_dict['timestamp'] = datetime.fromtimestamp(change.timestamp).isoformat()
+                changes.append(change_dict)
         
         return changes
     
@@ -498,15 +875,48 @@ class LoggingSystem:
         Args:
             days: Number of days to keep logs
         """
-        cutoff_time = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         
-        for log_file in self.log_dir.glob("*.log*"):
-            try:
-                if log_file.stat().st_mtime < cutoff_time.timestamp():
-                    log_file.unlink()
-                    self.get_logger().info(f"Deleted old log file: {log_file}")
-            except Exception as e:
-                self.get_logger().error(f"Failed to delete log file {log_file}: {e}")
+        # scandir entries come with the file type (and, on Windows, the stat
+        # result) from the directory listing itself
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if '.log' not in entry.name:
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        self.get_logger().info("Deleted old log file: %s", entry.path)
+                except Exception as e:
+                    self.get_logger().error("Failed to delete log file %s: %s", entry.path, e)
+
+
+# Metrics buffered while a request is handled (recorded immediately when None)
+_metrics_batch: ContextVar[Optional[List[PerformanceMetric]]] = ContextVar(
+    '_metrics_batch', default=None
+)
+
+
+def begin_metrics_batch():
+    """
+    Start collecting performance_monitor metrics for the current context.
+    
+    Metrics measured until flush_metrics_batch() is called are buffered
+    instead of being recorded one by one.
+    """
+    _metrics_batch.set([])
+
+
+def flush_metrics_batch():
+    """
+    Record the metrics buffered since begin_metrics_batch() and stop buffering.
+    """
+    batch = _metrics_batch.get()
+    if batch is None:
+        return
+    _metrics_batch.set(None)
+    if batch:
+        get_logging_system().log_performance_batch(batch)
 
 
 def performance_monitor(operation_name: Optional[str] = None,
@@ -524,10 +934,16 @@ def performance_monitor(operation_name: Optional[str] = None,
         Decorator function
     """
     def decorator(func: Callable):
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        # Bound log_performance of the global logging system, resolved on the
+        # first call and re-resolved only if initialize_logging() replaces it
+        cached_system = None
+        log_perf = None
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
+            nonlocal cached_system, log_perf
+            start_time = time.perf_counter()
             success = True
             additional_data = {}
             
@@ -543,15 +959,28 @@ def performance_monitor(operation_name: Optional[str] = None,
                 additional_data['error'] = str(e)
                 raise
             finally:
-                duration = time.time() - start_time
-                logging_system = get_logging_system()
-                logging_system.log_performance(
-                    operation=op_name,
-                    duration=duration,
-                    category=category,
-                    additional_data=additional_data,
-                    success=success
-                )
+                duration = time.perf_counter() - start_time
+                batch = _metrics_batch.get()
+                if batch is not None:
+                    batch.append(PerformanceMetric(
+                        operation=op_name,
+                        duration=duration,
+                        timestamp=time.time(),
+                        category=category,
+                        additional_data=additional_data,
+                        success=success
+                    ))
+                else:
+                    if cached_system is None or cached_system is not _global_logging_system:
+                        cached_system = get_logging_system()
+                        log_perf = cached_system.log_performance
+                    log_perf(
+                        operation=op_name,
+                        duration=duration,
+                        category=category,
+                        additional_data=additional_data,
+                        success=success
+                    )
         
         return wrapper
     return decorator
@@ -611,7 +1040,10 @@ def get_logging_system() -> LoggingSystem:
 def initialize_logging(log_dir: str = "logs",
                       app_name: str = "instant_search_db",
                       max_log_size: int = 10 * 1024 * 1024,
-                      backup_count: int = 5) -> LoggingSystem:
+                      backup_count: int = 5,
+                      binary_format: bool = False,
+                      enable_console: bool = True,
+                      console_level: int = logging.WARNING) -> LoggingSystem:
     """
     Initialize the global logging system.
     
@@ -620,10 +1052,15 @@ def initialize_logging(log_dir: str = "logs",
         app_name: Application name for log files
         max_log_size: Maximum size of each log file in bytes
         backup_count: Number of backup log files to keep
+        binary_format: Write base64 MessagePack records instead of JSON
+        enable_console: Echo main/error logger warnings to the console
+        console_level: Minimum level written to the console
         
     Returns:
         Initialized LoggingSystem instance
     """
     global _global_logging_system
-    _global_logging_system = LoggingSystem(log_dir, app_name, max_log_size, backup_count)
+    _global_logging_system = LoggingSystem(log_dir, app_name, max_log_size,
+                                           backup_count, binary_format,
+                                           enable_console, console_level)
     return _global_logging_system
\ No newline at end of file
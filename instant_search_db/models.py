@@ -1,7 +1,11 @@
 import sqlite3
+import logging
 import os
 import csv
-from typing import List, Dict, Any, Optional
+import functools
+import itertools
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 
 from .config_manager import ConfigManager
 from .data_manager import DataManager
@@ -12,12 +16,67 @@ from .logging_system import get_logging_system, LogCategory, performance_monitor
 DB_FILE = "database.db"
 CSV_FILE = "data/items.csv"
 
+# キーワード検索で返す最大件数（search_items の limit 未指定時の既定値）
+SEARCH_RESULT_LIMIT = 50
+
+# CSVを解析済みの行を保存するSQLiteキャッシュの拡張子（CSVと同じ場所に置く）
+CSV_CACHE_SUFFIX = ".sqlite-cache"
+
+# init_db のたびに更新され、検索結果のキャッシュと読み取り接続を無効化する
+_db_version = 0
+
+# CSVに含まれるカテゴリ名（CSVの更新時刻, カテゴリ集合）。load_items_from_csv の
+# 読み込み時に記録し、get_category_counts でCSVを読み直さずに済むようにする
+_csv_categories_cache: Optional[Tuple[int, frozenset]] = None
+
+# カテゴリごとのアイテム数の集計結果 ((DB_FILE, _db_version), {カテゴリ名: 件数})。
+# items は init_db でしか変更されないため、再構築されるまで集計をやり直さない
+_category_db_counts_cache: Optional[Tuple[Tuple[str, int], Dict[str, int]]] = None
+
+# カテゴリ設定ごとの {カテゴリキー: 表示名}（load_categories が返す辞書, 対応表）。
+# 設定は再読み込みされるまで同じ辞書が返されるため、それを目印に使い回す
+_display_name_cache: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
+
+# スレッドごとの読み取り用接続（sqlite3 の接続はスレッド間で共有しない）
+_local = threading.local()
+
+# init_db がファイルを削除する前に更新し、すべてのスレッドの読み取り用接続を
+# 次の利用時に開き直させる（削除済みのファイルを読み続けないようにする）
+_connection_generation = 0
+
 # Configure logging
 logger = get_logging_system().get_logger(LogCategory.DATA_MANAGEMENT)
 
 # Global error handler
 error_handler = ErrorHandler(logger)
 
+def _get_connection(db_file: str, db_version: int) -> sqlite3.Connection:
+    """
+    現在のスレッドの読み取り用接続を返す
+    
+    接続は使い回すため、ページキャッシュとプリペアドステートメントの
+    キャッシュが呼び出し間で保持される。データベースファイルが切り替わるか
+    init_db で再構築された場合は（他のスレッドが再構築した場合も）開き直す。
+    """
+    key = (db_file, db_version, _connection_generation)
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        if _local.key == key:
+            return conn
+        conn.close()
+    
+    conn = sqlite3.connect(db_file)
+    _local.conn = conn
+    _local.key = key
+    return conn
+
+def _close_connection():
+    """現在のスレッドの読み取り用接続を閉じる"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
 def get_default_items():
     """デフォルトのアイテムデータを返す（CSVが利用できない場合）"""
     return [
@@ -28,6 +87,55 @@ def get_default_items():
         ('草・種 薬草', 'テ ○ 掛 ○ 食 ○ フェイ ○ 効果・補足 HPが25回復する。HPが最大の時に飲むとHPの最大値が1上昇。ゴースト系に投げると25ダメージ'),
     ]
 
+def iter_items_from_csv() -> Iterator[Tuple[str, str]]:
+    """
+    CSVファイルのアイテムを (表示名, 説明) のタプルとして1行ずつ返す
+    
+    全件をリストに載せずに処理できるよう、行を読むたびに返す。読み切った
+    時点でCSVに含まれるカテゴリ名を記録する。ファイルが開けない場合や
+    読み込みに失敗した場合は例外がそのまま送出される。
+    """
+    global _csv_categories_cache
+    
+    categories = set()
+    csv_mtime = os.stat(CSV_FILE).st_mtime_ns
+    
+    with open(CSV_FILE, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        
+        # ヘッダーから列位置を一度だけ求め、各行は位置で参照する（行ごとのdict生成を避ける）
+        columns = {column: index for index, column in enumerate(next(reader, []))}
+        category_index = columns.get('category')
+        name_index = columns.get('name')
+        description_index = columns.get('description')
+        if category_index is None or name_index is None:
+            # カテゴリ名とアイテム名がなければ読み込めるアイテムはない
+            reader = ()
+        strip = str.strip
+        # 同じ説明文やカテゴリ名は1つの文字列オブジェクトを共有する
+        intern = {}.setdefault
+        
+        for row in reader:
+            if not row:
+                continue
+            try:
+                category = strip(row[category_index])
+                name = strip(row[name_index])
+                description = strip(row[description_index]) if description_index is not None else ''
+                category = intern(category, category)
+                description = intern(description, description)
+            except Exception as e:
+                logger.warning("Failed to process CSV row: %s", e)
+                continue
+            
+            if category:
+                categories.add(category)
+            if category and name:
+                # データベース用の形式: "カテゴリ名 アイテム名"
+                yield (f"{category} {name}", description)
+    
+    _csv_categories_cache = (csv_mtime, frozenset(categories))
+
 @performance_monitor("load_items_from_csv", LogCategory.DATA_MANAGEMENT)
 @graceful_degradation(get_default_items)
 def load_items_from_csv(config_manager: Optional[ConfigManager] = None):
@@ -43,274 +151,499 @@ def load_items_from_csv(config_manager: Optional[ConfigManager] = None):
     if not os.path.exists(CSV_FILE):
         error = FileNotFoundError(f"CSV file not found: {CSV_FILE}")
         error_handler.handle_error(error, context, "csv_file_not_found")
-        logger.warning(f"CSVファイル '{CSV_FILE}' が見つかりません。デフォルトデータを使用します。")
+        logger.warning("CSVファイル '%s' が見つかりません。デフォルトデータを使用します。", CSV_FILE)
         return get_default_items()
     
     try:
         # 直接CSVファイルを読み込み（シンプルな方法）
-        result_items = []
-        
-        with open(CSV_FILE, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                try:
-                    category = row.get('category', '').strip()
-                    name = row.get('name', '').strip()
-                    description = row.get('description', '').strip()
-                    
-                    if category and name:
-                        # データベース用の形式: "カテゴリ名 アイテム名"
-                        display_name = f"{category} {name}"
-                        result_items.append((display_name, description))
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process CSV row: {e}")
-                    continue
-        
-        logger.info(f"CSVから {len(result_items)} 件のアイテムを読み込みました。")
+        result_items = list(iter_items_from_csv())
+        logger.info("CSVから %d 件のアイテムを読み込みました。", len(result_items))
         return result_items
         
     except Exception as e:
         error_handler.handle_error(e, context)
-        logger.error(f"CSVファイルの読み込みエラー: {e}")
+        logger.error("CSVファイルの読み込みエラー: %s", e)
         return get_default_items()
 
+def _item_rows(items: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, str, Optional[str], str]]:
+    """(表示名, 説明) を items テーブルの1行 (name, description, category, item_name) に変換する"""
+    for name, description in items:
+        yield (name, description) + _split_display_name(name)
+
+# 複数行 INSERT 1文あたりの行数（4列 x 100行 = 400パラメータで、古いSQLiteの上限999にも収まる）
+_INSERT_CHUNK_ROWS = 100
+
+@functools.lru_cache(maxsize=None)
+def _multi_row_insert_sql(row_count: int) -> str:
+    """row_count 行をまとめて投入する INSERT 文を返す（行数ごとに1度だけ組み立てる）"""
+    return (
+        "INSERT INTO items (name, description, category, item_name) VALUES "
+        + ",".join(["(?, ?, ?, ?)"] * row_count)
+    )
+
+def _insert_items(cursor: sqlite3.Cursor, rows: Iterable[Tuple[str, str, Optional[str], str]]):
+    """
+    items テーブルに行を投入する
+    
+    _INSERT_CHUNK_ROWS 行ずつ複数行の VALUES を持つ1つの INSERT 文にまとめて
+    実行し、1行ごとに文を実行する executemany よりも呼び出し回数を減らす。
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, _INSERT_CHUNK_ROWS))
+        if not chunk:
+            break
+        cursor.execute(_multi_row_insert_sql(len(chunk)), list(itertools.chain.from_iterable(chunk)))
+
+def _split_display_name(display_name: str) -> Tuple[Optional[str], str]:
+    """"カテゴリ名 アイテム名" 形式の名前を (カテゴリ名, アイテム名) に分割する"""
+    category, separator, item_name = display_name.partition(' ')
+    if not separator:
+        return (None, display_name)
+    return (category, item_name)
+
+def _csv_cache_path() -> str:
+    """CSVファイルに対応するキャッシュファイルのパスを返す（data/items.csv -> data/items.sqlite-cache）"""
+    return os.path.splitext(CSV_FILE)[0] + CSV_CACHE_SUFFIX
+
+def _csv_cache_key() -> Optional[Tuple[int, int]]:
+    """キャッシュの有効性を判定するCSVの (更新時刻, サイズ) を返す。CSVがなければ None"""
+    try:
+        stat = os.stat(CSV_FILE)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _attach_items_cache(cursor: sqlite3.Cursor, cache_key: Tuple[int, int]) -> bool:
+    """
+    CSVキャッシュを "cache" としてアタッチする
+    
+    キャッシュが存在し、記録されたCSVの更新時刻とサイズが現在のCSVと
+    一致する場合のみ True を返す。一致しない場合はアタッチを解除する。
+    """
+    cache_path = _csv_cache_path()
+    if not os.path.exists(cache_path):
+        return False
+    
+    try:
+        cursor.execute("ATTACH DATABASE ? AS cache", (cache_path,))
+    except sqlite3.Error as e:
+        logger.warning("CSVキャッシュを開けません: %s", e)
+        return False
+    
+    try:
+        cursor.execute("SELECT csv_mtime_ns, csv_size FROM cache.meta")
+        if cursor.fetchone() == cache_key:
+            return True
+    except sqlite3.Error as e:
+        logger.warning("CSVキャッシュが読み込めません: %s", e)
+    cursor.execute("DETACH DATABASE cache")
+    return False
+
+def _write_items_cache(conn: sqlite3.Connection, cache_key: Tuple[int, int], categories: frozenset):
+    """
+    投入済みの items テーブルをCSVキャッシュに書き出す
+    
+    一時ファイルに書き込んでから置き換えるため、書き込み途中のキャッシュが
+    読まれることはない。書き込みに失敗しても初期化自体は続行する。
+    """
+    cache_path = _csv_cache_path()
+    temp_path = cache_path + ".tmp"
+    try:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        cursor = conn.cursor()
+        cursor.execute("ATTACH DATABASE ? AS cache", (temp_path,))
+        try:
+            cursor.executescript("""
+            BEGIN;
+            CREATE TABLE cache.meta (csv_mtime_ns INTEGER NOT NULL, csv_size INTEGER NOT NULL);
+            CREATE TABLE cache.categories (category TEXT NOT NULL);
+            CREATE TABLE cache.items AS SELECT name, description, category, item_name FROM main.items ORDER BY id;
+            """)
+            cursor.execute("INSERT INTO cache.meta VALUES (?, ?)", cache_key)
+            cursor.executemany(
+                "INSERT INTO cache.categories VALUES (?)", ((category,) for category in categories)
+            )
+            conn.commit()
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            cursor.execute("DETACH DATABASE cache")
+        os.replace(temp_path, cache_path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("CSVキャッシュを書き込めません: %s", e)
+
 def init_db(config_manager: Optional[ConfigManager] = None):
     """データベースを初期化し、サンプルデータを投入する（設定ベース）"""
+    global _db_version, _csv_categories_cache, _connection_generation
     if config_manager is None:
         config_manager = ConfigManager()
     
-    # 既存のデータベースを削除して再作成
+    # 既存のデータベースを削除して再作成（他のスレッドの接続も次の利用時に開き直す）
+    _connection_generation += 1
+    _close_connection()
     if os.path.exists(DB_FILE):
         os.remove(DB_FILE)
-        print(f"既存の'{DB_FILE}'を削除しました。")
+        logger.info("既存の'%s'を削除しました。", DB_FILE)
+    # WALモードの -wal / -shm が残っていると新しいファイルに古いログが適用されるため削除する
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(DB_FILE + suffix):
+            os.remove(DB_FILE + suffix)
 
-    print(f"'{DB_FILE}'を新規作成して初期化します。")
+    logger.info("'%s'を新規作成して初期化します。", DB_FILE)
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
 
+    # 一括投入用のPRAGMA設定（DBは起動のたびに再作成されるため同期書き込みは不要）
+    cursor.executescript("""
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    """)
+
+    # CSVが前回から変わっていなければ、解析済みのキャッシュをアタッチして使う
+    # （ATTACH はトランザクション外で行う必要がある）
+    cache_key = _csv_cache_key()
+    use_cache = cache_key is not None and _attach_items_cache(cursor, cache_key)
+    write_cache = False
+
+    # テーブル作成からインデックス構築までを1トランザクションで実行
+    cursor.execute("BEGIN")
+
     # 1. 通常テーブルの作成
     cursor.execute("""
     CREATE TABLE items (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         name TEXT NOT NULL,
-        description TEXT NOT NULL
+        description TEXT NOT NULL,
+        category TEXT,
+        item_name TEXT
     )
     """)
     
-    # 2. FTS5仮想テーブルの作成
+    # 2. データの投入
+    if use_cache:
+        # キャッシュから解析済みの行をそのままコピー（CSVの解析は行わない）
+        cursor.execute(
+            "INSERT INTO items (name, description, category, item_name) "
+            "SELECT name, description, category, item_name FROM cache.items ORDER BY rowid"
+        )
+        cursor.execute("SELECT category FROM cache.categories")
+        _csv_categories_cache = (cache_key[0], frozenset(row[0] for row in cursor.fetchall()))
+        logger.info("CSVキャッシュからデータを読み込みました。")
+    else:
+        # CSVファイルから1行ずつ読み込んで投入（全件をメモリに載せない）
+        # "カテゴリ名 アイテム名" 形式の名前から、カテゴリとアイテム名も列として保持する
+        try:
+            _insert_items(cursor, _item_rows(iter_items_from_csv()))
+            write_cache = cache_key is not None
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            context = ErrorContext(file_path=CSV_FILE, function_name="init_db")
+            pattern = "csv_file_not_found" if isinstance(e, FileNotFoundError) else None
+            error_handler.handle_error(e, context, pattern)
+            logger.warning("CSVファイル '%s' を読み込めません。デフォルトデータを使用します: %s", CSV_FILE, e)
+            cursor.execute("DELETE FROM items")
+            _insert_items(cursor, _item_rows(get_default_items()))
+    cursor.execute("CREATE INDEX idx_items_category ON items(category)")
+
+    # 3. FTS5仮想テーブルの作成（データ投入後に作成し、インデックスを一括構築する）
+    #    検索ではヒットした rowid と rank だけを使い、本文は items から取得するため
+    #    列の内容を持たない contentless テーブルにする。trigram トークナイザは
+    #    語の途中を含む部分文字列で検索できるため、空白で区切られない日本語でも
+    #    LIKE '%検索語%' と同じアイテムが見つかる
     try:
         cursor.execute("""
         CREATE VIRTUAL TABLE items_fts USING fts5(
             name, 
             description,
-            content='items',
-            content_rowid='id'
+            content='',
+            tokenize='trigram'
         )
         """)
-        print("FTS5仮想テーブルを作成しました。")
+        logger.info("FTS5仮想テーブルを作成しました。")
     except sqlite3.OperationalError as e:
-        print(f"FTS5が利用できません: {e}")
-
-    # 3. 設定ベースでCSVファイルからデータを読み込み
-    sample_data = load_items_from_csv(config_manager)
-    
-    cursor.executemany("INSERT INTO items (name, description) VALUES (?, ?)", sample_data)
-
-    # 4. FTSインデックスの構築
-    try:
-        cursor.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild')")
-        print("FTSインデックスを構築しました。")
-    except sqlite3.OperationalError:
-        print("FTSインデックスの構築をスキップしました。")
+        logger.warning("FTS5が利用できません: %s", e)
+    else:
+        # 4. FTSインデックスの構築
+        try:
+            cursor.execute(
+                "INSERT INTO items_fts(rowid, name, description) "
+                "SELECT id, name, description FROM items"
+            )
+            logger.info("FTSインデックスを構築しました。")
+        except sqlite3.OperationalError:
+            logger.warning("FTSインデックスの構築をスキップしました。")
 
     conn.commit()
+    if use_cache:
+        cursor.execute("DETACH DATABASE cache")
+    elif write_cache and _csv_categories_cache is not None:
+        # 次回の init_db でCSVを解析せずに済むよう、投入結果をキャッシュに保存
+        _write_items_cache(conn, cache_key, _csv_categories_cache[1])
     conn.close()
-    print("データベースの初期化が完了しました。")
+    _db_version += 1
+    logger.info("データベースの初期化が完了しました。")
+
+# trigram トークナイザで検索できる検索語の最小文字数
+_FTS_MIN_TERM_LENGTH = 3
+
+def _build_fts_query(query_term: str) -> Optional[str]:
+    """
+    検索語からFTS5のMATCH式を組み立てる
+    
+    検索語全体をダブルクォートで囲んだ1つのフレーズにすることで、"-" や "*" などが
+    FTS5の演算子として解釈されないようにする。trigram トークナイザではフレーズが
+    語の途中を含む任意の位置の部分文字列に一致するため、FTS5は LIKE '%検索語%' と
+    同じアイテムを返す。3文字未満の検索語は trigram では検索できないため None を返し、
+    LIKE検索に任せる。
+    """
+    if len(query_term) < _FTS_MIN_TERM_LENGTH:
+        return None
+    return '"' + query_term.replace('"', '""') + '"'
 
-def search_items(query_term, category_filter='', config_manager: Optional[ConfigManager] = None):
-    """アイテムを検索する（設定ベース）"""
-    print(f"検索クエリ: '{query_term}', カテゴリフィルタ: '{category_filter}'")
+def search_items(query_term, category_filter='', config_manager: Optional[ConfigManager] = None,
+                 limit: Optional[int] = None):
+    """
+    アイテムを検索する（設定ベース）
+    
+    Args:
+        query_term: 検索キーワード
+        category_filter: カテゴリで絞り込む場合のカテゴリキー
+        config_manager: カテゴリ設定の取得に使う ConfigManager
+        limit: キーワード検索で返す最大件数（省略時は SEARCH_RESULT_LIMIT）。
+            カテゴリでの絞り込みには適用されない
+    
+    Returns:
+        アイテムの辞書 (id, name, description) のリスト
+    """
+    logger.debug("検索クエリ: '%s', カテゴリフィルタ: '%s'", query_term, category_filter)
     
     if config_manager is None:
-        config_manager = ConfigManager()
+        config_manager = _get_default_config_manager()
     
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    category_name = None
+    if category_filter:
+        category_name = _resolve_category_name(category_filter, config_manager)
+    
+    # 同じ検索は init_db で再構築されるまでキャッシュから返す（呼び出し側での変更に備えてコピーする）
+    if limit is None:
+        limit = SEARCH_RESULT_LIMIT
+    results = _search_items_cached(DB_FILE, _db_version, query_term, category_name, limit)
+    return [dict(row) for row in results]
 
-    # まずデータベースの内容を確認
-    cursor.execute("SELECT COUNT(*) as count FROM items")
-    count = cursor.fetchone()['count']
-    print(f"データベース内のアイテム数: {count}")
+@functools.lru_cache(maxsize=1)
+def _get_default_config_manager() -> ConfigManager:
+    """config_manager が渡されない場合に使う共有の ConfigManager"""
+    return ConfigManager()
 
+def _resolve_category_name(category_filter: str, config_manager: ConfigManager) -> str:
+    """カテゴリフィルタから、items.category と照合するカテゴリ表示名を求める"""
     # 設定からカテゴリ情報を取得
     try:
         categories_config = config_manager.load_categories()
-        category_names = list(categories_config.keys()) if categories_config else []
     except Exception as e:
-        print(f"カテゴリ設定の読み込みエラー: {e}")
-        category_names = []
+        logger.warning("カテゴリ設定の読み込みエラー: %s", e)
+        return category_filter
+    
+    # 設定にないカテゴリの場合は元のカテゴリ名を使用
+    if not categories_config:
+        return category_filter
+    return _get_display_names(categories_config).get(category_filter, category_filter)
+
+def _resolve_display_name(category_key: str, category_info: Any) -> str:
+    """カテゴリ設定の1件から表示名を求める"""
+    # CategoryConfigオブジェクトの場合は属性でアクセス
+    if hasattr(category_info, 'display_name'):
+        return category_info.display_name
+    elif isinstance(category_info, dict):
+        return category_info.get('display_name', category_key)
+    return category_key
+
+def _get_display_names(categories_config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    カテゴリ設定から {カテゴリキー: 表示名} の対応表を返す
+    
+    同じ設定の辞書に対しては前回作成した対応表を返し、カテゴリごとの
+    属性・型の判定を呼び出しのたびに繰り返さないようにする。
+    """
+    global _display_name_cache
+    
+    cached = _display_name_cache
+    if cached is not None and cached[0] is categories_config:
+        return cached[1]
+    
+    display_names = {
+        category_key: _resolve_display_name(category_key, category_info)
+        for category_key, category_info in categories_config.items()
+    }
+    _display_name_cache = (categories_config, display_names)
+    return display_names
+
+# 検索クエリが返す列（行はタプルで受け取り、この列名で辞書にする）
+_SEARCH_COLUMNS = ('id', 'name', 'description')
+
+@functools.lru_cache(maxsize=512)
+def _search_items_cached(db_file: str, db_version: int, query_term: str,
+                         category_name: Optional[str], limit: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    データベースを検索する（結果はLRUキャッシュに保持される）
+    
+    db_file と db_version はキャッシュキーの一部で、init_db による再構築や
+    データベースファイルの切り替え後に古い結果が返らないようにする。
+    """
+    cursor = _get_connection(db_file, db_version).cursor()
+
+    # まずデータベースの内容を確認（件数はデバッグ出力にしか使わないため、DEBUG時のみ集計）
+    if logger.isEnabledFor(logging.DEBUG):
+        cursor.execute("SELECT COUNT(*) FROM items")
+        logger.debug("データベース内のアイテム数: %d", cursor.fetchone()[0])
 
     # カテゴリフィルタがある場合
-    if category_filter:
-        print(f"カテゴリフィルタ適用: {category_filter}")
-        
-        # 設定されたカテゴリ名を使用してフィルタリング
-        if category_filter in category_names:
-            # 設定からカテゴリの表示名を取得
-            try:
-                category_info = categories_config[category_filter]
-                if hasattr(category_info, 'display_name'):
-                    category_display_name = category_info.display_name
-                elif isinstance(category_info, dict):
-                    category_display_name = category_info.get('display_name', category_filter)
-                else:
-                    category_display_name = category_filter
-                
-                cursor.execute(
-                    "SELECT * FROM items WHERE name LIKE ?",
-                    (f"{category_display_name}%",)
-                )
-            except (KeyError, AttributeError):
-                # フォールバック: 元のカテゴリ名を使用
-                cursor.execute(
-                    "SELECT * FROM items WHERE name LIKE ?",
-                    (f"{category_filter}%",)
-                )
-        else:
-            # 設定にないカテゴリの場合は元の方法を使用
-            cursor.execute(
-                "SELECT * FROM items WHERE name LIKE ?",
-                (f"{category_filter}%",)
-            )
-        
-        results = [dict(row) for row in cursor.fetchall()]
-        print(f"カテゴリ検索結果: {len(results)}件")
-    else:
-        # 通常の検索（LIKE検索を試行）
-        search_pattern = f"%{query_term}%"
-        
-        # 設定から検索対象フィールドを取得
-        try:
-            field_config = config_manager.load_field_mappings()
-            if isinstance(field_config, dict):
-                search_fields = field_config.get('search_fields', ['name', 'description'])
-            else:
-                search_fields = ['name', 'description']
-        except Exception as e:
-            print(f"フィールド設定の読み込みエラー: {e}")
-            search_fields = ['name', 'description']
-        
-        # 基本的な検索（name と description）
+    if category_name is not None:
+        logger.debug("カテゴリフィルタ適用: %s", category_name)
         cursor.execute(
-            "SELECT * FROM items WHERE name LIKE ? OR description LIKE ?",
-            (search_pattern, search_pattern)
+            "SELECT id, name, description FROM items WHERE category = ?",
+            (category_name,)
         )
-        results = [dict(row) for row in cursor.fetchall()]
-        print(f"LIKE検索を使用: {len(results)}件")
-        
-        # FTS5が利用可能で結果が少ない場合は試行
-        if len(results) == 0:
+        results = [dict(zip(_SEARCH_COLUMNS, row)) for row in cursor.fetchall()]
+        logger.debug("カテゴリ検索結果: %d件", len(results))
+    else:
+        # まずFTS5の転置インデックスで検索（関連度順）
+        # 上位件数の絞り込みはサブクエリ内で行い、FTS5の rank 列による上位K件の
+        # 最適化を効かせてから items と結合する
+        results = None
+        fts_query = _build_fts_query(query_term)
+        if fts_query is not None:
             try:
                 cursor.execute(
-                    "SELECT items.* FROM items_fts JOIN items ON items.id = items_fts.rowid WHERE items_fts MATCH ?",
-                    (query_term,)
+                    "SELECT items.id, items.name, items.description "
+                    "FROM (SELECT rowid, rank FROM items_fts WHERE items_fts MATCH ? "
+                    "ORDER BY rank LIMIT ?) AS hits "
+                    "JOIN items ON items.id = hits.rowid ORDER BY hits.rank",
+                    (fts_query, limit)
                 )
-                fts_results = [dict(row) for row in cursor.fetchall()]
-                if len(fts_results) > 0:
-                    results = fts_results
-                    print(f"FTS5検索で追加: {len(fts_results)}件")
+                results = [dict(zip(_SEARCH_COLUMNS, row)) for row in cursor.fetchall()]
+                logger.debug("FTS5検索を使用: %d件", len(results))
             except sqlite3.OperationalError as e:
-                print(f"FTS5検索エラー: {e}")
+                logger.warning("FTS5検索エラー: %s", e)
+        
+        # FTS5で検索できない場合（3文字未満の検索語、FTS5が使えない環境）だけ
+        # 全件を走査するLIKE検索を使う。FTS5の結果が0件でもLIKE検索は行わない
+        if results is None:
+            search_pattern = f"%{query_term}%"
+            cursor.execute(
+                "SELECT id, name, description FROM items WHERE name LIKE ? OR description LIKE ? "
+                "ORDER BY id LIMIT ?",
+                (search_pattern, search_pattern, limit)
+            )
+            results = [dict(zip(_SEARCH_COLUMNS, row)) for row in cursor.fetchall()]
+            logger.debug("LIKE検索を使用: %d件", len(results))
 
-    conn.close()
-    return results
+    return tuple(results)
+
+def _get_csv_categories() -> frozenset:
+    """
+    CSVファイルに含まれるカテゴリ名を返す
+    
+    load_items_from_csv が記録した結果をCSVの更新時刻が変わるまで再利用し、
+    未記録または更新されている場合のみCSVを読み直す。
+    """
+    global _csv_categories_cache
+    
+    if not os.path.exists(CSV_FILE):
+        return frozenset()
+    
+    csv_mtime = os.stat(CSV_FILE).st_mtime_ns
+    cached = _csv_categories_cache
+    if cached is not None and cached[0] == csv_mtime:
+        return cached[1]
+    
+    categories = set()
+    with open(CSV_FILE, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            category = row.get('category', '').strip()
+            if category:
+                categories.add(category)
+    
+    _csv_categories_cache = (csv_mtime, frozenset(categories))
+    return _csv_categories_cache[1]
 
 def get_category_counts(config_manager: Optional[ConfigManager] = None):
     """各カテゴリのアイテム数を取得する（設定ベース）"""
-    if config_manager is None:
-        config_manager = ConfigManager()
+    global _category_db_counts_cache
     
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    if config_manager is None:
+        config_manager = _get_default_config_manager()
     
     # CSVファイルから直接カテゴリを取得（より正確）
     csv_categories = set()
     try:
-        if os.path.exists(CSV_FILE):
-            with open(CSV_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    category = row.get('category', '').strip()
-                    if category:
-                        csv_categories.add(category)
-        logger.info(f"CSV categories found: {list(csv_categories)}")
+        csv_categories = set(_get_csv_categories())
+        logger.debug("CSV categories found: %s", csv_categories)
     except Exception as e:
-        logger.error(f"Failed to read categories from CSV: {e}")
+        logger.error("Failed to read categories from CSV: %s", e)
     
     # データベースからもカテゴリを取得（フォールバック）
-    db_categories = set()
-    try:
-        cursor.execute('''
-            SELECT DISTINCT SUBSTR(name, 1, INSTR(name, " ") - 1) as category 
-            FROM items 
-            WHERE INSTR(name, " ") > 0 
-            ORDER BY category
-        ''')
-        db_categories = set(row[0] for row in cursor.fetchall())
-        logger.info(f"Database categories found: {list(db_categories)}")
-    except Exception as e:
-        logger.error(f"Failed to get categories from database: {e}")
+    # カテゴリごとの件数も1回の GROUP BY でまとめて集計し、init_db で再構築されるまで再利用する
+    db_counts = {}
+    db_key = (DB_FILE, _db_version)
+    cached = _category_db_counts_cache
+    if cached is not None and cached[0] == db_key:
+        db_counts = cached[1]
+    else:
+        try:
+            cursor = _get_connection(DB_FILE, _db_version).cursor()
+            cursor.execute('''
+                SELECT category, COUNT(*) 
+                FROM items 
+                WHERE category IS NOT NULL 
+                GROUP BY category
+            ''')
+            db_counts = {row[0]: row[1] for row in cursor.fetchall()}
+            _category_db_counts_cache = (db_key, db_counts)
+            logger.debug("Database categories found: %s", db_counts.keys())
+        except Exception as e:
+            logger.error("Failed to get categories from database: %s", e)
     
     # CSVとデータベースの両方からカテゴリを統合
-    all_categories = csv_categories.union(db_categories)
+    all_categories = csv_categories.union(db_counts)
     
     # 設定からカテゴリ情報を取得
     categories_config = {}
     try:
         categories_config = config_manager.load_categories()
-        logger.info(f"Loaded {len(categories_config)} categories from config")
+        logger.debug("Loaded %d categories from config", len(categories_config))
     except Exception as e:
-        logger.warning(f"カテゴリ設定の読み込みエラー: {e}")
+        logger.warning("カテゴリ設定の読み込みエラー: %s", e)
     
     # 各カテゴリのアイテム数をカウント
     category_counts = {}
+    # カテゴリごとのデバッグログは、DEBUGが無効なら呼び出し自体を省く
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
     # 設定にあるカテゴリをチェック
-    for category_key, category_info in categories_config.items():
-        # CategoryConfigオブジェクトの場合は属性でアクセス
-        if hasattr(category_info, 'display_name'):
-            display_name = category_info.display_name
-        elif isinstance(category_info, dict):
-            display_name = category_info.get('display_name', category_key)
-        else:
-            display_name = category_key
-        
-        # データベースでカテゴリ名で検索（両方の形式をチェック）
-        cursor.execute("SELECT COUNT(*) as count FROM items WHERE name LIKE ?", (f"{display_name}%",))
-        result = cursor.fetchone()
-        count = result[0] if result else 0
+    for category_key, display_name in _get_display_names(categories_config).items():
+        # 集計結果からカテゴリ名で検索（両方の形式をチェック）
+        count = db_counts.get(display_name, 0)
         
         # カウントが0の場合、category_keyでも試す
         if count == 0 and category_key != display_name:
-            cursor.execute("SELECT COUNT(*) as count FROM items WHERE name LIKE ?", (f"{category_key}%",))
-            result = cursor.fetchone()
-            count = result[0] if result else 0
+            count = db_counts.get(category_key, 0)
         
         category_counts[category_key] = count
-        logger.debug(f"Category '{category_key}' ({display_name}): {count} items")
+        if debug_enabled:
+            logger.debug("Category '%s' (%s): %d items", category_key, display_name, count)
     
     # 実際のデータにあるが設定にないカテゴリも追加
     for actual_cat in all_categories:
         if actual_cat not in category_counts:
-            cursor.execute("SELECT COUNT(*) as count FROM items WHERE name LIKE ?", (f"{actual_cat}%",))
-            result = cursor.fetchone()
-            count = result[0] if result else 0
+            count = db_counts.get(actual_cat, 0)
             category_counts[actual_cat] = count
-            logger.debug(f"Actual category '{actual_cat}': {count} items")
+            if debug_enabled:
+                logger.debug("Actual category '%s': %d items", actual_cat, count)
     
-    conn.close()
-    logger.info(f"Category counts: {category_counts}")
+    logger.debug("Category counts: %s", category_counts)
     return category_counts
\ No newline at end of file
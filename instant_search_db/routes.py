@@ -1,5 +1,12 @@
 from flask import Blueprint, jsonify, render_template, request, current_app
+import functools
+import hashlib
 import logging
+import os
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from .models import search_items, get_category_counts
 from .config_manager import ConfigManager
 from .error_handler import ErrorHandler, ErrorContext, graceful_degradation
@@ -13,6 +20,182 @@ bp = Blueprint('main', __name__)
 # Global error handler for routes
 error_handler = ErrorHandler(logger)
 
+# Cached config API payloads {cache name: (config file signature, payload)}
+_config_payload_cache: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+def _config_signature(config_manager: ConfigManager) -> Tuple:
+    """
+    Return the (path, mtime) of every JSON file in the config and examples
+    directories. The value changes when any of them is added, removed or updated.
+    """
+    entries = []
+    for directory in (config_manager.config_dir, config_manager.examples_dir):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.json'):
+                        entries.append((entry.path, entry.stat().st_mtime_ns))
+        except OSError:
+            continue
+    entries.sort()
+    return (id(config_manager), tuple(entries))
+
+def _config_etag(name: str, signature: Tuple) -> str:
+    """
+    Build the ETag of a config API response from the config file signature
+    
+    Args:
+        name: Cache name (gives each endpoint its own ETag)
+        signature: Return value of _config_signature()
+    
+    Returns:
+        ETag value (unquoted)
+    """
+    return hashlib.blake2b(repr((name, signature)).encode('utf-8'), digest_size=16).hexdigest()
+
+def _not_modified_response(etag: str):
+    """Return a 304 response if the client already has this ETag, otherwise None"""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+def _cached_config_payload(name: str, config_manager: ConfigManager,
+                           build: Callable[[], Optional[Dict[str, Any]]],
+                           signature: Optional[Tuple] = None) -> Optional[Dict[str, Any]]:
+    """
+    Reuse a payload built from the configuration until the config files change
+    
+    Args:
+        name: Cache name
+        config_manager: ConfigManager used to load the configuration
+        build: Builds the payload on a cache miss (a None result is not cached)
+        signature: Precomputed config file signature (computed here if omitted)
+    
+    Returns:
+        Payload dictionary (callers must not modify it)
+    """
+    if signature is None:
+        signature = _config_signature(config_manager)
+    cached = _config_payload_cache.get(name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    payload = build()
+    if payload is not None:
+        _config_payload_cache[name] = (signature, payload)
+    return payload
+
+# ConfigManager of the app handling the current request (set in before_request)
+_config_manager_var: ContextVar[Optional[ConfigManager]] = ContextVar('config_manager', default=None)
+
+@bp.before_request
+def _bind_config_manager():
+    """Look up the app's ConfigManager once at the start of each request"""
+    _config_manager_var.set(getattr(current_app, 'config_manager', None))
+
+@functools.lru_cache(maxsize=1)
+def _get_config_manager() -> ConfigManager:
+    """Shared ConfigManager used when the app does not provide one"""
+    return ConfigManager()
+
+@functools.lru_cache(maxsize=1)
+def _get_fallback_config_valid() -> bool:
+    """Validation result of the shared ConfigManager (validated once)"""
+    return _get_config_manager().validate_all_configs()
+
+@functools.lru_cache(maxsize=4)
+def _get_cached_template(app, template_name: str):
+    """Keep the compiled template per application"""
+    return app.jinja_env.get_template(template_name)
+
+def _get_index_template():
+    """
+    Return the compiled index.html template
+    
+    When template auto-reload is enabled (debug mode) the template is fetched
+    from the Jinja loader every time so edits are picked up. url_for and
+    request are available as Jinja environment globals, so the template can be
+    rendered without render_template's context processing.
+    """
+    app = current_app._get_current_object()
+    if app.jinja_env.auto_reload:
+        return app.jinja_env.get_template('index.html')
+    return _get_cached_template(app, 'index.html')
+
+class IndexData(NamedTuple):
+    """Configuration and category counts used to render the index page"""
+    ui_config: Any
+    categories_config: Dict[str, Any]
+    field_mappings: Dict[str, Any]
+    category_counts: Dict[str, int]
+    errors: List[Tuple[Exception, str]]
+
+# (IndexData field, loader, default factory on failure, warning message on failure)
+_INDEX_LOADERS = (
+    ("ui_config", lambda cm: cm.load_ui_settings(), lambda: None,
+     "Failed to load UI settings, using defaults"),
+    ("categories_config", lambda cm: cm.load_categories(), dict,
+     "Failed to load categories, using defaults"),
+    ("field_mappings", lambda cm: cm.load_field_mappings(), dict,
+     "Failed to load field mappings, using defaults"),
+    # Get category counts with configuration integration
+    ("category_counts", get_category_counts, dict,
+     "Failed to get category counts, using empty counts"),
+)
+
+def _load_index_data(config_manager: ConfigManager) -> IndexData:
+    """
+    Load the configuration and category counts for the index page
+    
+    Each field is loaded separately and falls back to its default on failure.
+    The exceptions are collected in errors with their warning message so the
+    caller can handle them together.
+    """
+    values = {}
+    errors = []
+    for field, load, default, warning in _INDEX_LOADERS:
+        try:
+            values[field] = load(config_manager)
+        except Exception as e:
+            values[field] = default()
+            errors.append((e, warning))
+    return IndexData(errors=errors, **values)
+
+# Last rendered index page (config objects used, category counts, other values, HTML)
+_index_page_cache: Optional[Tuple[Tuple, Dict[str, int], Tuple, str]] = None
+
+def _render_index_page(index_data: IndexData, config_valid: bool) -> str:
+    """
+    Render the index page
+    
+    The previous HTML is returned as is while the config objects are the same
+    (not reloaded) and the category counts and other values are unchanged.
+    Rendering happens every time when template auto-reload is enabled.
+    """
+    global _index_page_cache
+    
+    app = current_app._get_current_object()
+    config_objects = (app, index_data.ui_config, index_data.categories_config, index_data.field_mappings)
+    values = (config_valid, request.script_root)
+    
+    cached = _index_page_cache
+    if (cached is not None and not app.jinja_env.auto_reload
+            and all(a is b for a, b in zip(cached[0], config_objects))
+            and cached[1] == index_data.category_counts and cached[2] == values):
+        return cached[3]
+    
+    page = _get_index_template().render(
+        category_counts=index_data.category_counts,
+        ui_config=index_data.ui_config,
+        categories_config=index_data.categories_config,
+        field_mappings=index_data.field_mappings,
+        config_valid=config_valid
+    )
+    _index_page_cache = (config_objects, dict(index_data.category_counts), values, page)
+    return page
+
 @bp.route('/')
 @performance_monitor("route_index", LogCategory.USER_INTERACTION)
 def index():
@@ -21,71 +204,43 @@ def index():
     # Log user action
     log_user_action("access_index_page", additional_data={"user_agent": request.headers.get('User-Agent')})
     
-    context = ErrorContext(
-        function_name="index",
-        user_action="access_index_page"
-    )
+    # The error context is only built when an error occurs
+    def error_context():
+        return ErrorContext(
+            function_name="index",
+            user_action="access_index_page"
+        )
     
     try:
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
+        config_manager = _config_manager_var.get()
         config_valid = getattr(current_app, 'config_valid', False)
         
-        # Fallback to creating new instance if not available in app context
+        # Fallback to the shared instance if not available in app context
         if config_manager is None:
             try:
-                config_manager = ConfigManager()
-                # Validate configuration on page load with error handling
-                if not config_manager.validate_all_configs():
+                config_manager = _get_config_manager()
+                # Validate configuration once with error handling
+                if not _get_fallback_config_valid():
                     logger.warning("Configuration validation issues detected")
                     config_valid = False
                 else:
                     config_valid = True
             except Exception as e:
-                error_handler.handle_error(e, context)
+                error_handler.handle_error(e, error_context())
                 logger.warning("Configuration validation failed, continuing with available configs")
                 config_valid = False
         
         # Load configuration data for template with graceful degradation
-        ui_config = None
-        categories_config = {}
-        field_mappings = {}
-        category_counts = {}
-        
-        try:
-            ui_config = config_manager.load_ui_settings()
-        except Exception as e:
-            error_handler.handle_error(e, context)
-            logger.warning("Failed to load UI settings, using defaults")
-        
-        try:
-            categories_config = config_manager.load_categories()
-        except Exception as e:
-            error_handler.handle_error(e, context)
-            logger.warning("Failed to load categories, using defaults")
+        index_data = _load_index_data(config_manager)
+        for error, warning in index_data.errors:
+            error_handler.handle_error(error, error_context())
+            logger.warning(warning)
         
-        try:
-            field_mappings = config_manager.load_field_mappings()
-        except Exception as e:
-            error_handler.handle_error(e, context)
-            logger.warning("Failed to load field mappings, using defaults")
-        
-        try:
-            # Get category counts with configuration integration
-            category_counts = get_category_counts(config_manager)
-        except Exception as e:
-            error_handler.handle_error(e, context)
-            logger.warning("Failed to get category counts, using empty counts")
-        
-        return render_template('index.html', 
-                             category_counts=category_counts,
-                             ui_config=ui_config,
-                             categories_config=categories_config,
-                             field_mappings=field_mappings,
-                             config_valid=config_valid)
+        return _render_index_page(index_data, config_valid)
     
     except Exception as e:
-        error_info = error_handler.handle_error(e, context)
+        error_info = error_handler.handle_error(e, error_context())
         logger.error(f"Critical error in index route: {e}")
         
         # Return error page with user-friendly message
@@ -97,6 +252,11 @@ def index():
                              error_message="設定の読み込みに失敗しました。デフォルト設定を使用します。",
                              error_id=error_info.error_id), 500
 
+@functools.lru_cache(maxsize=256)
+def _parse_fields(custom_fields: str) -> frozenset:
+    """Turn the comma-separated 'fields' parameter into a set of field names"""
+    return frozenset(field.strip() for field in custom_fields.split(','))
+
 @bp.route('/search')
 @performance_monitor("route_search", LogCategory.SEARCH)
 def search():
@@ -106,6 +266,11 @@ def search():
     カスタムフィールド検索をサポート
     """
     query_term = request.args.get('q', '')
+    
+    # An empty query (e.g. a cleared search box) returns at once, without logging
+    if not query_term:
+        return jsonify([])
+    
     category_filter = request.args.get('category', '')
     custom_fields = request.args.get('fields', '')
     
@@ -117,32 +282,30 @@ def search():
         "ip_address": request.remote_addr
     })
     
-    context = ErrorContext(
-        function_name="search",
-        user_action="search_request",
-        additional_data={
-            "query": query_term,
-            "category": category_filter,
-            "custom_fields": custom_fields
-        }
-    )
+    # The error context is only built when an error occurs
+    def error_context():
+        return ErrorContext(
+            function_name="search",
+            user_action="search_request",
+            additional_data={
+                "query": query_term,
+                "category": category_filter,
+                "custom_fields": custom_fields
+            }
+        )
     
     try:
         logger.info(f"Search request: query='{query_term}', category='{category_filter}', fields='{custom_fields}'")
         
-        if not query_term:
-            logger.info("Empty query, returning empty results")
-            return jsonify([])
-        
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
+        config_manager = _config_manager_var.get()
         
-        # Fallback to creating new instance if not available in app context
+        # Fallback to the shared instance if not available in app context
         if config_manager is None:
             try:
-                config_manager = ConfigManager()
+                config_manager = _get_config_manager()
             except Exception as e:
-                error_handler.handle_error(e, context)
+                error_handler.handle_error(e, error_context())
                 logger.warning("Failed to initialize ConfigManager, using default search")
         
         # Enhanced search with custom field support and error handling
@@ -150,7 +313,7 @@ def search():
         try:
             results = search_items(query_term, category_filter, config_manager)
         except Exception as e:
-            error_handler.handle_error(e, context)
+            error_handler.handle_error(e, error_context())
             logger.error(f"Search operation failed: {e}")
             return jsonify({
                 "error": "検索中にエラーが発生しました",
@@ -161,35 +324,33 @@ def search():
         # Filter results based on custom fields if specified
         if custom_fields and results:
             try:
-                field_list = [f.strip() for f in custom_fields.split(',')]
-                filtered_results = []
-                
-                for result in results:
-                    # Check if any of the specified custom fields contain the query
-                    for field in field_list:
-                        if field in result and query_term.lower() in str(result[field]).lower():
-                            filtered_results.append(result)
-                            break
+                field_set = _parse_fields(custom_fields)
+                query_lower = query_term.lower()
                 
-                results = filtered_results
+                # Keep results where any of the specified custom fields contain the query
+                results = [
+                    result for result in results
+                    if any(field in result and query_lower in str(result[field]).lower()
+                           for field in field_set)
+                ]
                 logger.info(f"Filtered results by custom fields: {len(results)} items")
                 
             except Exception as e:
-                error_handler.handle_error(e, context)
+                error_handler.handle_error(e, error_context())
                 logger.warning(f"Custom field filtering failed: {e}, returning unfiltered results")
         
         logger.info(f"Search completed: {len(results)} results returned")
         return jsonify(results)
         
     except Exception as e:
-        error_info = error_handler.handle_error(e, context)
+        error_info = error_handler.handle_error(e, error_context())
         logger.error(f"Critical error in search endpoint: {e}")
         
         return jsonify({
             "error": "検索中に予期しないエラーが発生しました",
             "message": "システム管理者に連絡してください。",
             "error_id": error_info.error_id,
-            "timestamp": error_info.timestamp.isoformat()
+            "timestamp": error_info.timestamp_iso
         }), 500
 
 @bp.route('/api/config')
@@ -197,46 +358,35 @@ def get_current_config():
     """現在の設定を取得するAPIエンドポイント"""
     try:
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
-        if config_manager is None:
-            config_manager = ConfigManager()
-        
-        # Load all configurations
-        categories_config = config_manager.load_categories()
-        field_mappings = config_manager.load_field_mappings()
-        ui_config = config_manager.load_ui_settings()
-        
-        # Convert CategoryConfig objects to dictionaries
-        categories_dict = {}
-        for key, category in categories_config.items():
-            categories_dict[key] = {
-                "display_name": category.display_name,
-                "icon": category.icon,
-                "emoji_fallback": category.emoji_fallback,
-                "color": category.color,
-                "description": category.description
+        config_manager = _config_manager_var.get() or _get_config_manager()
+        
+        def build_config_data():
+            # Load all configurations (CategoryConfig / UIConfig are converted
+            # to dictionaries once per configuration load by ConfigManager)
+            return {
+                "categories": config_manager.get_categories_dict(),
+                "field_mappings": config_manager.load_field_mappings(),
+                "ui": config_manager.get_ui_settings_dict(),
+                "status": "success"
             }
         
-        # Convert UIConfig to dictionary
-        ui_dict = {
-            "title": ui_config.title,
-            "subtitle": ui_config.subtitle,
-            "theme": ui_config.theme,
-            "layout": ui_config.layout,
-            "search": ui_config.search,
-            "categories": ui_config.categories
-        }
+        # Answer with 304 and no body while the config files are unchanged
+        signature = _config_signature(config_manager)
+        etag = _config_etag("config", signature)
+        not_modified = _not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
         
-        config_data = {
-            "categories": categories_dict,
-            "field_mappings": field_mappings,
-            "ui": ui_dict,
-            "status": "success",
-            "timestamp": __import__('datetime').datetime.now().isoformat()
-        }
+        # Reuse the previously built payload until the config files change
+        config_data = dict(
+            _cached_config_payload("config", config_manager, build_config_data, signature),
+            timestamp=datetime.now().isoformat()
+        )
         
         logger.info("Configuration data retrieved successfully")
-        return jsonify(config_data)
+        response = jsonify(config_data)
+        response.set_etag(etag, weak=True)
+        return response
         
     except Exception as e:
         logger.error(f"Error retrieving configuration: {e}")
@@ -251,41 +401,20 @@ def validate_config():
     """設定ファイルを検証するAPIエンドポイント"""
     try:
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
-        if config_manager is None:
-            config_manager = ConfigManager()
+        config_manager = _config_manager_var.get() or _get_config_manager()
         
-        # Validate all configurations
-        is_valid = config_manager.validate_all_configs()
+        # Validate all configurations (each file is reloaded once)
+        validation_details = config_manager.validate_detailed()
+        is_valid = all(detail["status"] == "valid" for detail in validation_details.values())
         
         validation_result = {
             "is_valid": is_valid,
             "status": "success" if is_valid else "warning",
             "message": "すべての設定が有効です" if is_valid else "一部の設定に問題があります",
-            "timestamp": __import__('datetime').datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat()
         }
         
         # Add detailed validation info
-        validation_details = {}
-        
-        try:
-            config_manager.load_categories(force_reload=True)
-            validation_details["categories"] = {"status": "valid", "message": "カテゴリ設定は有効です"}
-        except Exception as e:
-            validation_details["categories"] = {"status": "error", "message": f"カテゴリ設定エラー: {str(e)}"}
-        
-        try:
-            config_manager.load_field_mappings(force_reload=True)
-            validation_details["fields"] = {"status": "valid", "message": "フィールド設定は有効です"}
-        except Exception as e:
-            validation_details["fields"] = {"status": "error", "message": f"フィールド設定エラー: {str(e)}"}
-        
-        try:
-            config_manager.load_ui_settings(force_reload=True)
-            validation_details["ui"] = {"status": "valid", "message": "UI設定は有効です"}
-        except Exception as e:
-            validation_details["ui"] = {"status": "error", "message": f"UI設定エラー: {str(e)}"}
-        
         validation_result["details"] = validation_details
         
         logger.info(f"Configuration validation completed: {is_valid}")
@@ -304,54 +433,68 @@ def list_example_configs():
     """利用可能なサンプル設定を一覧表示するAPIエンドポイント"""
     try:
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
-        if config_manager is None:
-            config_manager = ConfigManager()
-        
-        # Get list of example configurations
-        examples = config_manager.get_example_configs()
-        
-        # Get detailed information for each example
-        example_details = []
-        for example_name in examples:
-            try:
-                example_config = config_manager.load_example_config(example_name)
-                if example_config:
-                    example_info = {
-                        "name": example_name,
-                        "title": example_config.get("title", example_name),
-                        "description": example_config.get("description", "サンプル設定"),
-                        "use_case": example_config.get("use_case", "汎用"),
-                        "categories_count": len(example_config.get("categories", {}).get("categories", {})),
-                        "has_custom_fields": bool(example_config.get("field_mappings", {}).get("custom_fields")),
-                        "available": True
-                    }
-                else:
-                    example_info = {
+        config_manager = _config_manager_var.get() or _get_config_manager()
+        
+        def build_example_list():
+            # Get list of example configurations
+            examples = config_manager.get_example_configs()
+            
+            # Get detailed information for each example
+            example_details = []
+            for example_name in examples:
+                try:
+                    example_config = config_manager.load_example_config(example_name)
+                    if example_config:
+                        example_info = {
+                            "name": example_name,
+                            "title": example_config.get("title", example_name),
+                            "description": example_config.get("description", "サンプル設定"),
+                            "use_case": example_config.get("use_case", "汎用"),
+                            "categories_count": len(example_config.get("categories", {}).get("categories", {})),
+                            "has_custom_fields": bool(example_config.get("field_mappings", {}).get("custom_fields")),
+                            "available": True
+                        }
+                    else:
+                        example_info = {
+                            "name": example_name,
+                            "title": example_name,
+                            "description": "設定の読み込みに失敗しました",
+                            "available": False
+                        }
+                    example_details.append(example_info)
+                except Exception as e:
+                    logger.warning(f"Error loading example {example_name}: {e}")
+                    example_details.append({
                         "name": example_name,
                         "title": example_name,
-                        "description": "設定の読み込みに失敗しました",
+                        "description": f"エラー: {str(e)}",
                         "available": False
-                    }
-                example_details.append(example_info)
-            except Exception as e:
-                logger.warning(f"Error loading example {example_name}: {e}")
-                example_details.append({
-                    "name": example_name,
-                    "title": example_name,
-                    "description": f"エラー: {str(e)}",
-                    "available": False
-                })
+                    })
+            
+            return {
+                "examples": example_details,
+                "count": len(example_details),
+                "status": "success"
+            }
         
-        result = {
-            "examples": example_details,
-            "count": len(example_details),
-            "status": "success",
-            "timestamp": __import__('datetime').datetime.now().isoformat()
-        }
+        # Answer with 304 and no body while the example files are unchanged
+        signature = _config_signature(config_manager)
+        etag = _config_etag("examples", signature)
+        not_modified = _not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # Reuse the previously built list until the example files change
+        result = dict(
+            _cached_config_payload("examples", config_manager, build_example_list, signature),
+            timestamp=datetime.now().isoformat()
+        )
+        example_details = result["examples"]
         
         logger.info(f"Listed {len(example_details)} example configurations")
-        return jsonify(result)
+        response = jsonify(result)
+        response.set_etag(etag, weak=True)
+        return response
         
     except Exception as e:
         logger.error(f"Error listing example configurations: {e}")
@@ -366,12 +509,14 @@ def get_example_config(example_name):
     """特定のサンプル設定を取得するAPIエンドポイント"""
     try:
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
-        if config_manager is None:
-            config_manager = ConfigManager()
+        config_manager = _config_manager_var.get() or _get_config_manager()
         
         # Load the specific example configuration
-        example_config = config_manager.load_example_config(example_name)
+        # (reused until the files change; a missing example is not cached)
+        example_config = _cached_config_payload(
+            f"example:{example_name}", config_manager,
+            lambda: config_manager.load_example_config(example_name)
+        )
         
         if not example_config:
             return jsonify({
@@ -384,7 +529,7 @@ def get_example_config(example_name):
             "name": example_name,
             "config": example_config,
             "status": "success",
-            "timestamp": __import__('datetime').datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat()
         }
         
         logger.info(f"Retrieved example configuration: {example_name}")
@@ -398,15 +543,27 @@ def get_example_config(example_name):
             "status": "error"
         }), 500
 
+# Seconds a health check result is reused, so frequent monitoring polls do not recompute it
+HEALTH_CACHE_TTL = 5.0
+
+# Latest health check result (monotonic expiry time, ConfigManager, JSON body, HTTP status)
+_health_cache: Optional[Tuple[float, ConfigManager, bytes, int]] = None
+
 @bp.route('/api/system/health')
 @performance_monitor("route_health_check", LogCategory.SYSTEM)
 def system_health():
     """システムヘルスチェックAPIエンドポイント"""
     try:
+        global _health_cache
+        
         # Use configuration manager from app context if available
-        config_manager = getattr(current_app, 'config_manager', None)
-        if config_manager is None:
-            config_manager = ConfigManager()
+        config_manager = _config_manager_var.get() or _get_config_manager()
+        
+        # Return the serialized result of a recent health check if it is still fresh
+        now = time.monotonic()
+        cached = _health_cache
+        if cached is not None and cached[0] > now and cached[1] is config_manager:
+            return current_app.response_class(cached[2], status=cached[3], mimetype='application/json')
         
         # Perform comprehensive health check
         health_status = config_manager.health_check()
@@ -447,7 +604,10 @@ def system_health():
         elif health_status["overall_status"] == "degraded":
             status_code = 200  # Still operational but with warnings
         
-        return jsonify(health_status), status_code
+        response = jsonify(health_status)
+        response.status_code = status_code
+        _health_cache = (now + HEALTH_CACHE_TTL, config_manager, response.get_data(), status_code)
+        return response
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -455,7 +615,7 @@ def system_health():
             "overall_status": "unhealthy",
             "error": "ヘルスチェックに失敗しました",
             "message": str(e),
-            "timestamp": __import__('datetime').datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat()
         }), 503
 
 @bp.route('/api/system/errors')
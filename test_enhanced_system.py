@@ -3,6 +3,19 @@
 Test script for enhanced error handling and logging system
 """
 
+import logging
+import tempfile
+from contextlib import contextmanager
+
+@contextmanager
+def _silence_logging():
+    """Disable all logging output while the block runs"""
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
 def test_error_handling_and_logging():
     """Test the enhanced error handling and logging system"""
     print("Testing Enhanced Error Handling and Logging System...")
@@ -15,43 +28,47 @@ def test_error_handling_and_logging():
         from instant_search_db.logging_system import LoggingSystem, LogCategory
         print("   ✓ Modules imported successfully")
         
-        # Test 2: Create error handler
-        print("2. Testing error handler creation...")
-        error_handler = ErrorHandler()
-        print("   ✓ Error handler created successfully")
-        
-        # Test 3: Create logging system
-        print("3. Testing logging system creation...")
-        logging_system = LoggingSystem(log_dir="test_logs", app_name="test_app")
-        print("   ✓ Logging system created successfully")
-        
-        # Test 4: Test error handling
-        print("4. Testing error handling...")
-        test_error = FileNotFoundError("Test configuration file not found")
-        context = ErrorContext(file_path="test_config.json", function_name="test_function")
-        error_info = error_handler.handle_error(test_error, context, "config_file_not_found")
-        print(f"   ✓ Error handled with ID: {error_info.error_id}")
-        print(f"   ✓ User message: {error_info.user_message}")
-        
-        # Test 5: Test performance logging
-        print("5. Testing performance logging...")
-        logging_system.log_performance("test_operation", 1.5, success=True)
-        print(f"   ✓ Performance logged. Total metrics: {len(logging_system.performance_metrics)}")
-        
-        # Test 6: Test configuration change logging
-        print("6. Testing configuration change logging...")
-        logging_system.log_configuration_change("test_config", "old_value", "new_value", "test_user")
-        print(f"   ✓ Config change logged. Total changes: {len(logging_system.config_changes)}")
-        
-        # Test 7: Test performance summary
-        print("7. Testing performance summary...")
-        summary = logging_system.get_performance_summary(24)
-        print(f"   ✓ Performance summary generated. Total operations: {summary['total_operations']}")
-        
-        # Test 8: Test error summary
-        print("8. Testing error summary...")
-        error_summary = error_handler.get_error_summary()
-        print(f"   ✓ Error summary generated. Total errors: {error_summary['total_errors']}")
+        # Silence log output (handlers and file writes) and create log files in a temp directory
+        with _silence_logging(), tempfile.TemporaryDirectory() as log_dir:
+            # Test 2: Create error handler
+            print("2. Testing error handler creation...")
+            error_handler = ErrorHandler()
+            print("   ✓ Error handler created successfully")
+            
+            # Test 3: Create logging system
+            print("3. Testing logging system creation...")
+            logging_system = LoggingSystem(log_dir=log_dir, app_name="test_app")
+            print("   ✓ Logging system created successfully")
+            
+            # Test 4: Test error handling
+            print("4. Testing error handling...")
+            test_error = FileNotFoundError("Test configuration file not found")
+            context = ErrorContext(file_path="test_config.json", function_name="test_function")
+            error_info = error_handler.handle_error(test_error, context, "config_file_not_found")
+            print(f"   ✓ Error handled with ID: {error_info.error_id}")
+            print(f"   ✓ User message: {error_info.user_message}")
+            
+            # Test 5: Test performance logging
+            print("5. Testing performance logging...")
+            logging_system.log_performance("test_operation", 1.5, success=True)
+            print(f"   ✓ Performance logged. Total metrics: {len(logging_system.performance_metrics)}")
+            
+            # Test 6: Test configuration change logging
+            print("6. Testing configuration change logging...")
+            logging_system.log_configuration_change("test_config", "old_value", "new_value", "test_user")
+            print(f"   ✓ Config change logged. Total changes: {len(logging_system.config_changes)}")
+            
+            # Test 7: Test performance summary
+            print("7. Testing performance summary...")
+            summary = logging_system.get_performance_summary(24)
+            print(f"   ✓ Performance summary generated. Total operations: {summary['total_operations']}")
+            
+            # Test 8: Test error summary
+            print("8. Testing error summary...")
+            error_summary = error_handler.get_error_summary()
+            print(f"   ✓ Error summary generated. Total errors: {error_summary['total_errors']}")
+            
+            logging_system.shutdown()
         
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED! Enhanced system is working correctly.")
@@ -24,12 +24,12 @@ class PerformanceTestResult(unittest.TestResult):
     
     def startTest(self, test):
         super().startTest(test)
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
     
     def stopTest(self, test):
         super().stopTest(test)
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration = time.perf_counter() - self.start_time
             test_name = f"{test.__class__.__name__}.{test._testMethodName}"
             self.test_times[test_name] = duration
             
@@ -125,9 +125,9 @@ class PerformanceTestRunner:
             suite.addTests(tests)
         
         # Run tests
-        start_time = time.time()
+        start_time = time.perf_counter()
         suite.run(self.results)
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         # Generate report
         self._generate_report(total_time)
@@ -224,9 +224,9 @@ class PerformanceTestRunner:
             print(f"Unknown test category: {category}")
             return False
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         suite.run(self.results)
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         self._generate_report(total_time)
         return self.results.wasSuccessful()
@@ -5,9 +5,9 @@ import tempfile
 from instant_search_db import create_app
 from instant_search_db.models import init_db
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def app():
-    """テスト用のFlaskアプリケーションを作成"""
+    """テスト用のFlaskアプリケーションを作成（モジュール内のテストで共有する）"""
     # テスト用の一時データベースファイル
     db_fd, db_path = tempfile.mkstemp()
     
@@ -27,17 +27,75 @@ def app():
     os.close(db_fd)
     os.unlink(db_path)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def client(app):
     """テストクライアントを作成"""
     return app.test_client()
 
+@pytest.fixture(autouse=True)
+def _restore_app_state(app):
+    """テストが変更したアプリの設定とデータベースを元に戻す"""
+    import instant_search_db.models as models
+    
+    config_manager = app.config_manager
+    db_version = models._db_version
+    
+    yield
+    
+    app.config_manager = config_manager
+    # 別のCSVなどで init_db を実行したテストの後だけ、元のデータを投入し直す
+    if models._db_version != db_version:
+        with app.app_context():
+            init_db()
+
 def test_index_page(client):
     """トップページのテスト"""
     response = client.get('/')
     assert response.status_code == 200
     assert b'instant-search-db' in response.data or 'Roguelike Game'.encode('utf-8') in response.data
 
+def test_index_page_reused_until_counts_change(app, client, tmp_path, monkeypatch):
+    """トップページのHTMLがカテゴリ件数の変化まで再利用されるかテスト"""
+    import instant_search_db.models as models
+    import instant_search_db.routes as routes
+    
+    first = client.get('/').data
+    cached = routes._index_page_cache
+    assert client.get('/').data == first
+    assert routes._index_page_cache is cached
+    
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('category,name,description\n武器,つるはし,壁を掘れる\n', encoding='utf-8')
+    monkeypatch.setattr(models, 'CSV_FILE', str(csv_path))
+    with app.app_context():
+        init_db()
+    
+    assert client.get('/').data != first
+    assert routes._index_page_cache is not cached
+
+def test_index_data_falls_back_per_item(app):
+    """トップページ用の読み込みで、失敗した項目だけ既定値になるかテスト"""
+    from instant_search_db.routes import _load_index_data
+    
+    class BrokenCategoriesConfigManager:
+        def load_ui_settings(self):
+            return app.config_manager.load_ui_settings()
+        
+        def load_categories(self):
+            raise ValueError('broken categories')
+        
+        def load_field_mappings(self):
+            return {'field_mappings': {}}
+    
+    with app.app_context():
+        index_data = _load_index_data(BrokenCategoriesConfigManager())
+    
+    assert index_data.ui_config is app.config_manager.load_ui_settings()
+    assert index_data.categories_config == {}
+    assert index_data.field_mappings == {'field_mappings': {}}
+    assert index_data.category_counts
+    assert [str(error) for error, _ in index_data.errors] == ['broken categories']
+
 def test_search_empty_query(client):
     """空のクエリでの検索テスト"""
     response = client.get('/search')
@@ -58,6 +116,41 @@ def test_search_with_query(client):
         assert 'name' in data[0]
         assert 'description' in data[0]
 
+def test_search_custom_fields_filter(client):
+    """指定したフィールドにキーワードを含む結果だけに絞り込まれるかテスト"""
+    all_results = json.loads(client.get('/search?q=つるはし').data)
+    assert any('つるはし' in item['name'] for item in all_results)
+    
+    by_name = json.loads(client.get('/search?q=つるはし&fields=name, unknown').data)
+    assert by_name == [item for item in all_results if 'つるはし' in item['name']]
+    
+    by_unknown = json.loads(client.get('/search?q=つるはし&fields=unknown').data)
+    assert by_unknown == []
+
+def test_json_response_uses_orjson(app, client):
+    """JSONレスポンスが orjson で生成されるかテスト"""
+    pytest.importorskip('orjson')
+    from datetime import datetime
+    
+    response = client.get('/search?q=武器')
+    assert response.mimetype == 'application/json'
+    assert '武器'.encode('utf-8') in response.data
+    
+    with app.app_context():
+        body = app.json.response({'when': datetime(2024, 1, 2, 3, 4, 5), 1: 'one'}).get_data()
+    assert json.loads(body) == {'when': 'Tue, 02 Jan 2024 03:04:05 GMT', '1': 'one'}
+
+def test_json_response_honours_provider_options(app, monkeypatch):
+    """orjson で生成する場合も sort_keys と ensure_ascii の設定に従うかテスト"""
+    pytest.importorskip('orjson')
+    
+    with app.app_context():
+        assert app.json.response({'b': 1, 'a': 2}).get_data() == b'{"a":2,"b":1}\n'
+        monkeypatch.setattr(app.json, 'sort_keys', False)
+        assert app.json.response({'b': 1, 'a': 2}).get_data() == b'{"b":1,"a":2}\n'
+        monkeypatch.setattr(app.json, 'ensure_ascii', True)
+        assert app.json.response({'name': '武器'}).get_data() == b'{"name":"\\u6b66\\u5668"}\n'
+
 def test_search_no_results(client):
     """結果が見つからない検索のテスト"""
     response = client.get('/search?q=存在しないアイテム12345')
@@ -71,4 +164,377 @@ def test_search_special_characters(client):
     assert response.status_code == 200
     # エラーが発生せず、正常にレスポンスが返ることを確認
     data = json.loads(response.data)
-    assert isinstance(data, list)
\ No newline at end of file
+    assert isinstance(data, list)
+
+def test_search_full_term(client):
+    """語全体に一致する検索のテスト（FTS5の trigram インデックスを使用）"""
+    response = client.get('/search?q=つるはし')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data
+    assert all('つるはし' in item['name'] or 'つるはし' in item['description'] for item in data)
+
+def test_search_prefix_term(client):
+    """語の先頭部分での検索のテスト（3文字未満のためLIKE検索を使用）"""
+    response = client.get('/search?q=つる')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert any(item['name'] == '武器 つるはし' for item in data)
+
+def test_search_partial_term(client):
+    """語の一部分での検索のテスト（3文字未満のためLIKE検索を使用）"""
+    response = client.get('/search?q=るは')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert any('つるはし' in item['name'] for item in data)
+
+def test_search_matches_like_results(app):
+    """FTS5とLIKE検索のどちらを使う場合も、LIKE検索で一致するアイテムがすべて返るかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        for query in ('回復', 'HP', '攻撃', '満腹度', 'HPが', 'るはし'):
+            pattern = f"%{query}%"
+            expected = {row[0] for row in conn.execute(
+                "SELECT id FROM items WHERE name LIKE ? OR description LIKE ?", (pattern, pattern))}
+            assert expected
+            assert {item['id'] for item in models.search_items(query)} == expected
+    finally:
+        conn.close()
+
+def test_search_uses_fts_for_longer_terms(app):
+    """3文字以上の検索語はLIKE検索で全件を走査せずにFTS5だけで検索するかテスト"""
+    import instant_search_db.models as models
+    
+    conn = models._get_connection(models.DB_FILE, models._db_version)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        assert models.search_items('壁を掘れる')
+        assert models.search_items('存在しない語句') == []
+    finally:
+        conn.set_trace_callback(None)
+    
+    assert any('items_fts MATCH' in statement for statement in statements)
+    assert not any('LIKE' in statement for statement in statements)
+
+def test_search_results_limited(app, monkeypatch):
+    """検索結果が指定した件数までに絞り込まれるかテスト"""
+    import instant_search_db.models as models
+    
+    # 全文検索とLIKE検索の両方
+    for query in ('ダメージ', '攻'):
+        assert len(models.search_items(query)) > 2
+        assert len(models.search_items(query, limit=2)) == 2
+    
+    monkeypatch.setattr(models, 'SEARCH_RESULT_LIMIT', 1)
+    assert len(models.search_items('武器')) == 1
+
+def test_search_results_cached_until_reinitialized(app):
+    """同じ検索はキャッシュされ、init_db で無効化されることのテスト"""
+    import instant_search_db.models as models
+    
+    first = models.search_items('つるはし')
+    first[0]['name'] = 'changed'
+    hits_before = models._search_items_cached.cache_info().hits
+    second = models.search_items('つるはし')
+    
+    # キャッシュから返されるが、呼び出し側の変更は影響しない
+    assert models._search_items_cached.cache_info().hits == hits_before + 1
+    assert second[0]['name'] != 'changed'
+    
+    version = models._db_version
+    with app.app_context():
+        init_db()
+    assert models._db_version == version + 1
+    misses_before = models._search_items_cached.cache_info().misses
+    models.search_items('つるはし')
+    assert models._search_items_cached.cache_info().misses == misses_before + 1
+
+def test_init_db_streams_csv_items(app):
+    """CSVのアイテムがすべてデータベースに投入されるかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    expected = models.load_items_from_csv()
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        rows = conn.execute("SELECT name, description FROM items ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    assert rows == expected
+
+def test_init_db_reopens_connections_of_other_threads(app):
+    """init_db の後、別スレッドの読み取り用接続も開き直されるかテスト"""
+    import threading
+    import instant_search_db.models as models
+    
+    db_version = models._db_version
+    connections = []
+    rebuilt = threading.Event()
+    
+    def reader():
+        connections.append(models._get_connection(models.DB_FILE, db_version))
+        rebuilt.wait()
+        # 再構築前に読み取ったバージョンのままでも、削除済みのファイルを使い続けない
+        conn = models._get_connection(models.DB_FILE, db_version)
+        connections.append(conn)
+        connections.append(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+    
+    thread = threading.Thread(target=reader)
+    thread.start()
+    while not connections:
+        thread.join(0.01)
+    with app.app_context():
+        init_db()
+    rebuilt.set()
+    thread.join()
+    
+    assert connections[1] is not connections[0]
+    assert connections[2] > 0
+
+def test_init_db_without_csv_uses_default_items(app):
+    """CSVファイルがない場合にデフォルトデータが投入されるかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    original_csv = models.CSV_FILE
+    models.CSV_FILE = os.path.join(tempfile.gettempdir(), 'missing_items.csv')
+    try:
+        with app.app_context():
+            init_db()
+    finally:
+        models.CSV_FILE = original_csv
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        rows = conn.execute("SELECT name, description FROM items ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    assert rows == models.get_default_items()
+
+def test_init_db_reuses_csv_cache(app, tmp_path, monkeypatch):
+    """CSVが変わっていなければ2回目以降はキャッシュから投入されるかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('category,name,description\n武器,つるはし,壁を掘れる\n', encoding='utf-8')
+    monkeypatch.setattr(models, 'CSV_FILE', str(csv_path))
+    
+    with app.app_context():
+        init_db()
+    assert (tmp_path / 'items.sqlite-cache').exists()
+    
+    def fail_parse():
+        raise AssertionError('CSV should not be parsed')
+    monkeypatch.setattr(models, 'iter_items_from_csv', fail_parse)
+    with app.app_context():
+        init_db()
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        rows = conn.execute("SELECT name, description, category FROM items").fetchall()
+    finally:
+        conn.close()
+    assert rows == [('武器 つるはし', '壁を掘れる', '武器')]
+    assert models._get_csv_categories() == frozenset({'武器'})
+
+def test_init_db_ignores_stale_csv_cache(app, tmp_path, monkeypatch):
+    """CSVが更新された場合はキャッシュを使わずに読み直すかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('category,name,description\n武器,つるはし,壁を掘れる\n', encoding='utf-8')
+    monkeypatch.setattr(models, 'CSV_FILE', str(csv_path))
+    with app.app_context():
+        init_db()
+    
+    csv_path.write_text('category,name,description\n盾,皮甲の盾,錆びない\n盾,青銅甲の盾,防御力が高い\n', encoding='utf-8')
+    with app.app_context():
+        init_db()
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        rows = conn.execute("SELECT name FROM items ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    assert rows == [('盾 皮甲の盾',), ('盾 青銅甲の盾',)]
+
+def test_init_db_inserts_rows_across_chunks(app, tmp_path, monkeypatch):
+    """複数行INSERTのチャンク境界をまたいでも全行が順番通り投入されるかテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    row_count = models._INSERT_CHUNK_ROWS * 2 + 1
+    lines = ['category,name,description'] + [f'武器,item{i},説明{i}' for i in range(row_count)]
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    monkeypatch.setattr(models, 'CSV_FILE', str(csv_path))
+    
+    with app.app_context():
+        init_db()
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        rows = conn.execute("SELECT name, description FROM items ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    assert rows == [(f'武器 item{i}', f'説明{i}') for i in range(row_count)]
+
+def test_search_category_filter(app):
+    """カテゴリフィルタでの検索のテスト"""
+    import instant_search_db.models as models
+    
+    results = models.search_items('', '武器')
+    assert results
+    assert all(item['name'].startswith('武器 ') for item in results)
+    assert set(results[0]) == {'id', 'name', 'description'}
+
+def test_category_counts(app):
+    """カテゴリごとのアイテム数が実際の件数と一致することのテスト"""
+    import sqlite3
+    import instant_search_db.models as models
+    
+    counts = models.get_category_counts()
+    
+    conn = sqlite3.connect(models.DB_FILE)
+    try:
+        for category in ('武器', '盾', '草・種'):
+            expected = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE name LIKE ?", (f"{category} %",)
+            ).fetchone()[0]
+            assert counts[category] == expected
+            assert expected > 0
+    finally:
+        conn.close()
+
+def test_category_counts_reused_until_reinitialized(app, tmp_path, monkeypatch):
+    """カテゴリごとの件数が init_db で再構築されるまで再利用されるかテスト"""
+    import instant_search_db.models as models
+    
+    first = models.get_category_counts()
+    cached = models._category_db_counts_cache
+    assert models.get_category_counts() == first
+    assert models._category_db_counts_cache is cached
+    
+    csv_path = tmp_path / 'items.csv'
+    csv_path.write_text('category,name,description\n武器,つるはし,壁を掘れる\n', encoding='utf-8')
+    monkeypatch.setattr(models, 'CSV_FILE', str(csv_path))
+    with app.app_context():
+        init_db()
+    
+    assert models.get_category_counts()['武器'] == 1
+
+def test_category_counts_resolve_display_names(app):
+    """設定のキーと表示名が異なるカテゴリも1回の集計で数えられるかテスト"""
+    import instant_search_db.models as models
+    
+    class StubConfigManager:
+        def __init__(self, categories):
+            self.categories = categories
+        
+        def load_categories(self):
+            return self.categories
+    
+    config_manager = StubConfigManager({
+        'weapon': {'display_name': '武器'},
+        '盾': {'display_name': 'shield'},
+        'unknown': {'display_name': 'unknown'},
+    })
+    counts = models.get_category_counts(config_manager)
+    
+    default_counts = models.get_category_counts()
+    assert counts['weapon'] == default_counts['武器'] > 0
+    assert counts['盾'] == default_counts['盾'] > 0
+    assert counts['unknown'] == 0
+
+def test_example_config_cached_until_file_changes(app, client, tmp_path):
+    """サンプル設定がファイルの更新まで再利用されるかテスト"""
+    import shutil
+    from instant_search_db.config_manager import ConfigManager
+    
+    config_dir = tmp_path / 'config'
+    shutil.copytree('config', config_dir)
+    config_manager = ConfigManager(str(config_dir))
+    app.config_manager = config_manager
+    
+    loads = []
+    original_load = config_manager.load_example_config
+    def counting_load(name):
+        loads.append(name)
+        return original_load(name)
+    config_manager.load_example_config = counting_load
+    
+    first = json.loads(client.get('/api/config/examples/game-database').data)
+    second = json.loads(client.get('/api/config/examples/game-database').data)
+    assert first['config'] == second['config']
+    assert loads == ['game-database']
+    
+    example_path = config_dir / 'examples' / 'game-database.json'
+    example = json.loads(example_path.read_text(encoding='utf-8'))
+    example['title'] = 'updated title'
+    example_path.write_text(json.dumps(example, ensure_ascii=False), encoding='utf-8')
+    stat = os.stat(example_path)
+    os.utime(example_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    third = json.loads(client.get('/api/config/examples/game-database').data)
+    assert third['config']['title'] == 'updated title'
+    assert loads == ['game-database', 'game-database']
+
+def test_config_api_not_modified_until_file_changes(app, client, tmp_path):
+    """設定APIが設定ファイルの更新まで 304 を返すかテスト"""
+    import shutil
+    from instant_search_db.config_manager import ConfigManager
+    
+    config_dir = tmp_path / 'config'
+    shutil.copytree('config', config_dir)
+    app.config_manager = ConfigManager(str(config_dir))
+    
+    etags = {}
+    for url in ('/api/config', '/api/config/examples'):
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = etags[url] = first.headers['ETag']
+        
+        second = client.get(url, headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == etag
+    
+    categories_path = config_dir / 'categories.json'
+    stat = os.stat(categories_path)
+    os.utime(categories_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    third = client.get('/api/config', headers={'If-None-Match': etags['/api/config']})
+    assert third.status_code == 200
+    assert third.headers['ETag'] != etags['/api/config']
+
+def test_health_check_cached_for_ttl(app, client, monkeypatch):
+    """ヘルスチェック結果が有効期限内は再利用されるかテスト"""
+    import instant_search_db.routes as routes
+    
+    monkeypatch.setattr(routes, '_health_cache', None)
+    calls = []
+    original_health_check = app.config_manager.health_check
+    def counting_health_check():
+        calls.append(1)
+        return original_health_check()
+    monkeypatch.setattr(app.config_manager, 'health_check', counting_health_check)
+    
+    first = client.get('/api/system/health')
+    second = client.get('/api/system/health')
+    assert second.status_code == first.status_code
+    assert second.data == first.data
+    assert second.mimetype == 'application/json'
+    assert len(calls) == 1
+    
+    monkeypatch.setattr(routes, 'HEALTH_CACHE_TTL', 0)
+    monkeypatch.setattr(routes, '_health_cache', None)
+    client.get('/api/system/health')
+    client.get('/api/system/health')
+    assert len(calls) == 3
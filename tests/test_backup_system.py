@@ -10,10 +10,34 @@ import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 from instant_search_db.data_manager import DataManager
 from instant_search_db.config_manager import ConfigManager
 
 
+def _read_json(path):
+    """Read a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path, obj, indent=False):
+    """Write a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+
 class TestBackupSystem(unittest.TestCase):
     """Test cases for automated backup functionality."""
     
@@ -57,8 +81,7 @@ class TestBackupSystem(unittest.TestCase):
             }
         }
         
-        with open(os.path.join(self.config_dir, "categories.json"), 'w') as f:
-            json.dump(categories_config, f)
+        _write_json(os.path.join(self.config_dir, "categories.json"), categories_config)
         
         # Fields config
         fields_config = {
@@ -89,8 +112,7 @@ class TestBackupSystem(unittest.TestCase):
             }
         }
         
-        with open(os.path.join(self.config_dir, "fields.json"), 'w') as f:
-            json.dump(fields_config, f)
+        _write_json(os.path.join(self.config_dir, "fields.json"), fields_config)
         
         # UI config
         ui_config = {
@@ -100,8 +122,7 @@ class TestBackupSystem(unittest.TestCase):
             }
         }
         
-        with open(os.path.join(self.config_dir, "ui.json"), 'w') as f:
-            json.dump(ui_config, f)
+        _write_json(os.path.join(self.config_dir, "ui.json"), ui_config)
     
     def _create_test_file(self, filename: str, content: str = "test content") -> str:
         """Create a test file and return its path."""
@@ -141,8 +162,7 @@ class TestBackupSystem(unittest.TestCase):
         self.assertTrue(os.path.exists(retention_policy_path))
         
         # Verify retention policy content
-        with open(retention_policy_path, 'r') as f:
-            policy = json.load(f)
+        policy = _read_json(retention_policy_path)
         
         self.assertIn("retention_rules", policy)
         self.assertIn("daily_backups", policy["retention_rules"])
@@ -174,8 +194,7 @@ class TestBackupSystem(unittest.TestCase):
         self.assertTrue(os.path.exists(metadata_path))
         
         # Verify metadata content
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
         
         self.assertEqual(metadata["backup_type"], "data")
         self.assertEqual(metadata["file_type"], "file")
@@ -207,8 +226,7 @@ class TestBackupSystem(unittest.TestCase):
         metadata_path = os.path.join(os.path.dirname(backup_path), f"{backup_name}_metadata.json")
         self.assertTrue(os.path.exists(metadata_path))
         
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
         
         self.assertEqual(metadata["backup_type"], "config")
         self.assertEqual(metadata["file_type"], "directory")
@@ -225,8 +243,7 @@ class TestBackupSystem(unittest.TestCase):
         self.assertTrue(os.path.exists(index_path))
         
         # Verify index content
-        with open(index_path, 'r') as f:
-            index = json.load(f)
+        index = _read_json(index_path)
         
         self.assertIn("backups", index)
         self.assertIn("last_updated", index)
@@ -255,8 +272,7 @@ class TestBackupSystem(unittest.TestCase):
         backup_name = os.path.basename(backup_path)
         metadata_path = os.path.join(os.path.dirname(backup_path), f"{backup_name}_metadata.json")
         
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
         
         self.assertEqual(metadata["description"], "Before data update")
     
@@ -302,27 +318,23 @@ class TestBackupSystem(unittest.TestCase):
         backup_name = os.path.basename(backup_path)
         metadata_path = os.path.join(os.path.dirname(backup_path), f"{backup_name}_metadata.json")
         
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
         
         # Make backup appear 10 days old (should be cleaned up with default 7-day retention)
         old_date = (datetime.now() - timedelta(days=10)).isoformat()
         metadata["created_at"] = old_date
         metadata["retention_category"] = "daily"
         
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata, indent=True)
         
         # Update backup index with old date
         index_path = os.path.join(self.backup_dir, "backup_index.json")
-        with open(index_path, 'r') as f:
-            index = json.load(f)
+        index = _read_json(index_path)
         
         index["backups"][0]["created_at"] = old_date
         index["backups"][0]["retention_category"] = "daily"
         
-        with open(index_path, 'w') as f:
-            json.dump(index, f, indent=2)
+        _write_json(index_path, index, indent=True)
         
         # Perform cleanup
         cleanup_stats = self.data_manager.cleanup_old_backups()
@@ -350,8 +362,7 @@ class TestBackupSystem(unittest.TestCase):
         backup_name = os.path.basename(backup_path)
         metadata_path = os.path.join(os.path.dirname(backup_path), f"{backup_name}_metadata.json")
         
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+        metadata = _read_json(metadata_path)
         
         # Should be one of the valid retention categories
         self.assertIn(metadata["retention_category"], ["daily", "weekly", "monthly"])
@@ -141,11 +141,51 @@ class TestConfigManager(unittest.TestCase):
         categories3 = self.config_manager.load_categories(force_reload=True)
         self.assertIsNot(categories1, categories3)
     
+    def test_serialized_config_dicts(self):
+        """Test plain-dict forms of categories and UI settings are reused until reload"""
+        categories_dict = self.config_manager.get_categories_dict()
+        self.assertEqual(categories_dict["test_category"], {
+            "display_name": "Test Category",
+            "icon": "fas fa-test",
+            "emoji_fallback": "🧪",
+            "color": "#3498db",
+            "description": "Test category description"
+        })
+        self.assertIs(self.config_manager.get_categories_dict(), categories_dict)
+        
+        ui_dict = self.config_manager.get_ui_settings_dict()
+        ui_config = self.config_manager.load_ui_settings()
+        self.assertEqual(ui_dict["title"], ui_config.title)
+        self.assertEqual(set(ui_dict), {"title", "subtitle", "theme", "layout", "search", "categories"})
+        self.assertIs(self.config_manager.get_ui_settings_dict(), ui_dict)
+        
+        # Reloading the configuration rebuilds the dictionaries
+        self.config_manager.load_categories(force_reload=True)
+        self.config_manager.load_ui_settings(force_reload=True)
+        self.assertIsNot(self.config_manager.get_categories_dict(), categories_dict)
+        self.assertIsNot(self.config_manager.get_ui_settings_dict(), ui_dict)
+    
     def test_validate_all_configs(self):
         """Test validation of all configurations"""
         result = self.config_manager.validate_all_configs()
         self.assertTrue(result)
     
+    def test_validate_detailed(self):
+        """Test per-section validation results"""
+        details = self.config_manager.validate_detailed()
+        self.assertEqual(set(details), {"categories", "fields", "ui"})
+        self.assertTrue(all(detail["status"] == "valid" for detail in details.values()))
+        
+        with patch.object(self.config_manager, 'load_ui_settings',
+                          side_effect=ValueError("broken ui")) as load_ui:
+            details = self.config_manager.validate_detailed()
+            self.assertFalse(self.config_manager.validate_all_configs())
+        
+        load_ui.assert_called_with(force_reload=True)
+        self.assertEqual(details["ui"]["status"], "error")
+        self.assertIn("broken ui", details["ui"]["message"])
+        self.assertEqual(details["categories"]["status"], "valid")
+    
     def test_clear_cache(self):
         """Test cache clearing"""
         # Load configurations to populate cache
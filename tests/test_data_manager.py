@@ -302,7 +302,20 @@ class TestDataManager(unittest.TestCase):
         # Should be sorted by date (newest first)
         self.assertEqual(backups[0]['created_at'], "2024-01-02T10:00:00")
         self.assertEqual(backups[1]['created_at'], "2024-01-01T10:00:00")
-    
+
+    def test_list_backups_skips_invalid_metadata(self):
+        """Test that unreadable metadata files are skipped when listing backups."""
+        with open(self.data_manager.backup_dir / "good_metadata.json", 'w') as f:
+            json.dump({"created_at": "2024-01-01T10:00:00"}, f)
+
+        with open(self.data_manager.backup_dir / "broken_metadata.json", 'w') as f:
+            f.write("{not valid json")
+
+        backups = self.data_manager.list_backups()
+
+        self.assertEqual(len(backups), 1)
+        self.assertEqual(backups[0]['created_at'], "2024-01-01T10:00:00")
+
     def test_restore_backup_file(self):
         """Test restoring a file backup."""
         # Create backup file
@@ -81,7 +81,33 @@ class TestItem(unittest.TestCase):
         # Should fallback to default format
         display_name = self.item.get_display_name(field_config)
         self.assertEqual(display_name, "武器 つるはし")
-    
+
+    def test_get_display_name_malformed_config(self):
+        """Test display name with a malformed format string."""
+        field_config = {
+            "display_format": "{name"
+        }
+        # Should fallback to default format
+        display_name = self.item.get_display_name(field_config)
+        self.assertEqual(display_name, "武器 つるはし")
+
+    def test_get_display_name_format_reused(self):
+        """Test the same display format renders correctly for different items."""
+        field_config = {
+            "display_format": "{category}: {name} ({price})"
+        }
+        other = Item(id=2, category="盾", name="皮甲の盾", custom_fields={"price": 1000})
+        self.assertEqual(self.item.get_display_name(field_config), "武器: つるはし (240)")
+        self.assertEqual(other.get_display_name(field_config), "盾: 皮甲の盾 (1000)")
+
+    def test_get_display_name_nested_format_spec(self):
+        """Test display format with fields nested in a format spec."""
+        field_config = {
+            "display_format": "{name:>{width}}|{price:{fill}<6}"
+        }
+        item = Item(id=3, category="武器", name="剣", custom_fields={"width": 3, "fill": "*", "price": 10})
+        self.assertEqual(item.get_display_name(field_config), "  剣|10****")
+
     def test_get_search_text_default(self):
         """Test default search text generation."""
         search_text = self.item.get_search_text()
@@ -15,7 +15,8 @@ from instant_search_db.error_handler import (
 )
 from instant_search_db.logging_system import (
     LoggingSystem, get_logging_system, performance_monitor,
-    log_user_action, log_configuration_change
+    log_user_action, log_configuration_change,
+    begin_metrics_batch, flush_metrics_batch
 )
 
 
@@ -56,7 +57,16 @@ class TestErrorHandler(unittest.TestCase):
         error_info = self.error_handler.handle_error(error)
         
         self.assertEqual(error_info.category, ErrorCategory.FILE_IO)
-    
+
+    def test_enum_members_are_strings(self):
+        """Test that severity and category members behave as plain strings"""
+        self.assertEqual(ErrorSeverity.HIGH, "high")
+        self.assertEqual(str(ErrorCategory.FILE_IO), "file_io")
+        self.assertEqual(
+            json.dumps({"severity": ErrorSeverity.LOW, ErrorCategory.SYSTEM: 1}),
+            '{"severity": "low", "system": 1}'
+        )
+
     def test_recovery_callback_registration(self):
         """Test recovery callback registration and execution"""
         callback_executed = False
@@ -115,6 +125,37 @@ class TestErrorHandler(unittest.TestCase):
         result = failing_function()
         self.assertEqual(result, "fallback_result")
 
+    def test_graceful_degradation_preserves_metadata(self):
+        """Test graceful degradation decorator keeps the wrapped function's metadata"""
+
+        def original_function():
+            """Original docstring"""
+            return "ok"
+
+        wrapped = graceful_degradation(lambda: None)(original_function)
+
+        self.assertEqual(wrapped.__name__, "original_function")
+        self.assertEqual(wrapped.__doc__, "Original docstring")
+        self.assertIs(wrapped.__wrapped__, original_function)
+        self.assertEqual(wrapped(), "ok")
+
+    def test_graceful_degradation_records_arguments(self):
+        """Test graceful degradation stores the call arguments with the error"""
+        from instant_search_db.error_handler import get_error_handler
+
+        @graceful_degradation(lambda *args, **kwargs: "fallback_result")
+        def failing_function(value, option=None):
+            raise Exception("Function failed")
+
+        handler = get_error_handler()
+        with patch.object(handler.logger, "disabled", True):
+            self.assertEqual(failing_function(1, option="x"), "fallback_result")
+
+        error_info = list(handler.error_registry.values())[-1]
+        self.assertEqual(error_info.context.function_name, "failing_function")
+        self.assertEqual(error_info.context.additional_data,
+                         {"args": "(1,)", "kwargs": "{'option': 'x'}"})
+
 
 class TestLoggingSystem(unittest.TestCase):
     """Test cases for LoggingSystem class"""
@@ -130,6 +171,7 @@ class TestLoggingSystem(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures"""
         import shutil
+        self.logging_system.shutdown()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_logger_creation(self):
@@ -202,6 +244,32 @@ class TestLoggingSystem(unittest.TestCase):
         # Check that performance was logged
         self.assertTrue(len(self.logging_system.performance_metrics) > 0)
     
+    def test_performance_monitor_batched(self):
+        """Test that metrics are buffered until the batch is flushed"""
+        
+        @performance_monitor("batched_function")
+        def batched_function():
+            return "done"
+        
+        def batched_count():
+            return sum(1 for m in get_logging_system().performance_metrics
+                       if m.operation == "batched_function")
+        
+        before = batched_count()
+        begin_metrics_batch()
+        try:
+            self.assertEqual(batched_function(), "done")
+            self.assertEqual(batched_function(), "done")
+            self.assertEqual(batched_count(), before)
+        finally:
+            flush_metrics_batch()
+        
+        self.assertEqual(batched_count(), before + 2)
+        
+        # Without a buffer the metric is recorded immediately
+        batched_function()
+        self.assertEqual(batched_count(), before + 3)
+    
     def test_user_action_logging(self):
         """Test user action logging"""
         log_user_action(
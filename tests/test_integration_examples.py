@@ -165,14 +165,15 @@ class TestProductCatalogIntegration(TestExampleConfigurationsIntegration):
             items = []
             with open(data_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
+                custom_keys = tuple(k for k in reader.fieldnames or ()
+                                    if k not in ('category', 'product_name', 'description'))
                 for row in reader:
                     items.append({
                         'id': len(items) + 1,
                         'category': row.get('category', ''),
                         'name': row.get('product_name', ''),
                         'description': row.get('description', ''),
-                        'custom_fields': {k: v for k, v in row.items() 
-                                        if k not in ['category', 'product_name', 'description']}
+                        'custom_fields': {k: row[k] for k in custom_keys}
                     })
             
             mock_load.return_value = items
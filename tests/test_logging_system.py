@@ -10,8 +10,14 @@ import time
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from instant_search_db.logging_system import (
     LoggingSystem, LogLevel, LogCategory, StructuredFormatter,
+    BufferedRotatingFileHandler, BinaryStructuredFormatter,
     performance_monitor, log_user_action, log_configuration_change,
     get_logging_system, initialize_logging
 )
@@ -49,7 +55,11 @@ class TestStructuredFormatter(unittest.TestCase):
         self.assertEqual(log_data["module"], "test_module")
         self.assertEqual(log_data["function"], "test_function")
         self.assertEqual(log_data["line"], 10)
-    
+        self.assertEqual(
+            datetime.fromisoformat(log_data["timestamp"]).replace(microsecond=0),
+            datetime.fromtimestamp(int(record.created))
+        )
+
     def test_extra_fields_formatting(self):
         """Test formatting with extra fields"""
         import logging
@@ -80,6 +90,199 @@ class TestStructuredFormatter(unittest.TestCase):
         self.assertEqual(log_data["duration"], 1.5)
         self.assertEqual(log_data["additional_data"], {"key": "value"})
 
+    def test_unusual_values_formatting(self):
+        """Test formatting of non-ASCII text, non-string keys and huge integers"""
+        import logging
+
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="検索",
+            args=(),
+            exc_info=None
+        )
+        record.additional_data = {1: "one", "big": 2 ** 70}
+
+        formatted = self.formatter.format(record)
+        log_data = json.loads(formatted)
+
+        self.assertIn("検索", formatted)
+        self.assertEqual(log_data["message"], "検索")
+        self.assertEqual(log_data["additional_data"], {"1": "one", "big": 2 ** 70})
+
+    def test_non_json_values_formatting(self):
+        """Test that datetimes, enums, paths, bytes and sets are encoded the same by both encoders"""
+        import logging
+        from pathlib import Path
+
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.additional_data = {
+            "when": datetime(2024, 1, 2, 3, 4, 5),
+            "category": LogCategory.SEARCH,
+            "path": Path("data") / "items.csv",
+            "raw": b"abc",
+            "tags": {"weapon"}
+        }
+        expected = {
+            "when": "2024-01-02T03:04:05",
+            "category": "search",
+            "path": str(Path("data") / "items.csv"),
+            "raw": "YWJj",
+            "tags": ["weapon"]
+        }
+
+        formatted = self.formatter.format(record)
+        with patch('instant_search_db.logging_system.orjson', None):
+            fallback_formatted = self.formatter.format(record)
+
+        self.assertEqual(json.loads(formatted)["additional_data"], expected)
+        self.assertEqual(json.loads(fallback_formatted)["additional_data"], expected)
+        self.assertNotIn('", "', fallback_formatted)
+
+    def test_repeated_call_site_formatting(self):
+        """Test that records from one call site keep their own message and extras"""
+        import logging
+
+        entries = []
+        for i in range(2):
+            record = logging.LogRecord(
+                name="test_logger",
+                level=logging.WARNING,
+                pathname="test.py",
+                lineno=42,
+                msg="Item %d",
+                args=(i,),
+                exc_info=None
+            )
+            record.funcName = "test_function"
+            if i:
+                record.user_id = "test_user"
+            entries.append(json.loads(self.formatter.format(record)))
+
+        for i, entry in enumerate(entries):
+            self.assertEqual(entry["level"], "WARNING")
+            self.assertEqual(entry["logger"], "test_logger")
+            self.assertEqual(entry["function"], "test_function")
+            self.assertEqual(entry["line"], 42)
+            self.assertEqual(entry["message"], f"Item {i}")
+        self.assertNotIn("user_id", entries[0])
+        self.assertEqual(entries[1]["user_id"], "test_user")
+
+    def test_category_member_formatting(self):
+        """Test that LogCategory members are written as their string values"""
+        import logging
+
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.category = LogCategory.SEARCH
+
+        log_data = json.loads(self.formatter.format(record))
+
+        self.assertEqual(LogCategory.SEARCH, "search")
+        self.assertEqual(log_data["category"], "search")
+
+
+@unittest.skipUnless(msgpack, "msgpack is not installed")
+class TestBinaryStructuredFormatter(unittest.TestCase):
+    """Test cases for BinaryStructuredFormatter"""
+    
+    def test_entry_round_trip(self):
+        """Test that a packed entry decodes to the same fields as the JSON output"""
+        import base64
+        import logging
+        
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="検索 %s",
+            args=("test",),
+            exc_info=None
+        )
+        record.category = LogCategory.SEARCH
+        record.additional_data = {"count": 3}
+        
+        formatted = BinaryStructuredFormatter().format(record)
+        entry = msgpack.unpackb(base64.b64decode(formatted))
+        
+        self.assertNotIn("\n", formatted)
+        self.assertEqual(entry, json.loads(StructuredFormatter().format(record)))
+        self.assertEqual(entry["message"], "検索 test")
+        self.assertEqual(entry["category"], "search")
+
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    """Test cases for BufferedRotatingFileHandler"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, "buffered.log")
+        self.handler = BufferedRotatingFileHandler(
+            self.log_path, encoding='utf-8', flush_interval=3
+        )
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        self.handler.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _emit(self, level, msg):
+        import logging
+        self.handler.handle(logging.LogRecord(
+            "test_logger", level, "test.py", 1, msg, (), None
+        ))
+    
+    def _read(self):
+        with open(self.log_path, encoding='utf-8') as f:
+            return f.read()
+    
+    def test_info_records_are_buffered(self):
+        """Test that info records are only written once the interval is reached"""
+        import logging
+        
+        self._emit(logging.INFO, "first")
+        self._emit(logging.INFO, "second")
+        self.assertEqual(self._read(), "")
+        
+        self._emit(logging.INFO, "third")
+        self.assertEqual(self._read(), "first\nsecond\nthird\n")
+    
+    def test_warning_flushes_immediately(self):
+        """Test that warnings flush pending records"""
+        import logging
+        
+        self._emit(logging.INFO, "info")
+        self._emit(logging.WARNING, "warning")
+        self.assertEqual(self._read(), "info\nwarning\n")
+    
+    def test_close_flushes_pending_records(self):
+        """Test that closing the handler writes buffered records"""
+        import logging
+        
+        self._emit(logging.INFO, "pending")
+        self.handler.close()
+        self.assertEqual(self._read(), "pending\n")
+
 
 class TestLoggingSystem(unittest.TestCase):
     """Test cases for LoggingSystem class"""
@@ -97,6 +300,7 @@ class TestLoggingSystem(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures"""
         import shutil
+        self.logging_system.shutdown()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_initialization(self):
@@ -128,6 +332,53 @@ class TestLoggingSystem(unittest.TestCase):
         self.assertEqual(config_logger, self.logging_system.loggers['config'])
         self.assertEqual(performance_logger, self.logging_system.loggers['performance'])
     
+    def test_console_handlers(self):
+        """Test that only the main and error loggers echo to the console"""
+        import logging
+        
+        def console_handlers(logger):
+            return [h for h in logger.handlers if type(h) is logging.StreamHandler]
+        
+        temp_dir = tempfile.mkdtemp()
+        systems = []
+        try:
+            system = LoggingSystem(log_dir=temp_dir, app_name="test_console_on",
+                                   console_level=logging.ERROR)
+            systems.append(system)
+            main_handlers = console_handlers(system.loggers['main'])
+            self.assertEqual(len(main_handlers), 1)
+            self.assertEqual(main_handlers[0].level, logging.ERROR)
+            self.assertEqual(len(console_handlers(system.loggers['error'])), 1)
+            self.assertEqual(console_handlers(system.loggers['performance']), [])
+            
+            quiet = LoggingSystem(log_dir=temp_dir, app_name="test_console_off",
+                                  enable_console=False)
+            systems.append(quiet)
+            for logger in quiet.loggers.values():
+                self.assertEqual(console_handlers(logger), [])
+        finally:
+            import shutil
+            for system in systems:
+                system.shutdown()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_loggers_do_not_propagate_to_root(self):
+        """Test that records are not passed on to root logger handlers"""
+        import logging
+        
+        root_handler = MagicMock(spec=logging.Handler)
+        root_handler.level = logging.NOTSET
+        root_logger = logging.getLogger()
+        root_logger.addHandler(root_handler)
+        try:
+            self.logging_system.get_logger(LogCategory.SEARCH).warning("search warning")
+        finally:
+            root_logger.removeHandler(root_handler)
+        
+        root_handler.handle.assert_not_called()
+        for logger in self.logging_system.loggers.values():
+            self.assertFalse(logger.propagate)
+    
     def test_performance_logging(self):
         """Test performance metric logging"""
         operation = "test_operation"
@@ -152,6 +403,23 @@ class TestLoggingSystem(unittest.TestCase):
         self.assertEqual(metric.additional_data, additional_data)
         self.assertTrue(metric.success)
     
+    def test_performance_logging_when_level_disabled(self):
+        """Test that metrics are stored even if the performance logger is disabled"""
+        import logging
+        
+        logger = self.logging_system.get_logger(LogCategory.PERFORMANCE)
+        original_level = logger.level
+        logger.setLevel(logging.ERROR)
+        try:
+            with patch.object(logger, 'log') as mock_log:
+                self.logging_system.log_performance("quiet_operation", 0.5)
+        finally:
+            logger.setLevel(original_level)
+        
+        mock_log.assert_not_called()
+        self.assertEqual(len(self.logging_system.performance_metrics), 1)
+        self.assertEqual(self.logging_system.performance_metrics[0].operation, "quiet_operation")
+    
     def test_configuration_change_logging(self):
         """Test configuration change logging"""
         config_type = "categories"
@@ -195,6 +463,99 @@ class TestLoggingSystem(unittest.TestCase):
         # but we can ensure the method executes without error
         self.assertTrue(True)
     
+    def test_records_written_by_background_listener(self):
+        """Test that queued records reach the matching log file on shutdown"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            system = LoggingSystem(log_dir=temp_dir, app_name="test_queue_listener")
+            system.log_performance(operation="queued_operation", duration=0.5)
+            system.log_user_action(action="queued_action")
+            system.shutdown()
+
+            with open(os.path.join(temp_dir, "test_queue_listener_performance.log"), encoding='utf-8') as f:
+                performance_lines = [json.loads(line) for line in f if line.strip()]
+            with open(os.path.join(temp_dir, "test_queue_listener_user_actions.log"), encoding='utf-8') as f:
+                user_lines = [json.loads(line) for line in f if line.strip()]
+
+            self.assertEqual(len(performance_lines), 1)
+            self.assertEqual(performance_lines[0]["operation"], "queued_operation")
+            self.assertEqual(len(user_lines), 1)
+            self.assertEqual(user_lines[0]["message"], "User action: queued_action")
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_shutdown_detaches_handlers(self):
+        """Test that shutdown removes the handlers and the exit hook holds no reference"""
+        import gc
+        import weakref
+        temp_dir = tempfile.mkdtemp()
+        try:
+            system = LoggingSystem(log_dir=temp_dir, app_name="test_queue_detach")
+            logger = system.loggers["user"]
+            self.assertTrue(logger.handlers)
+
+            system.shutdown()
+            self.assertEqual(logger.handlers, [])
+
+            system = LoggingSystem(log_dir=temp_dir, app_name="test_queue_detach")
+            system_ref = weakref.ref(system)
+            del system
+            gc.collect()
+            self.assertIsNone(system_ref())
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_reinitialized_system_keeps_writing(self):
+        """Test that replacing the global system leaves the new one writing its log files"""
+        import gc
+        import shutil
+        import instant_search_db.logging_system as logging_system
+        temp_dir = tempfile.mkdtemp()
+        previous = logging_system._global_logging_system
+        try:
+            initialize_logging(log_dir=temp_dir, app_name="test_reinitialize", enable_console=False)
+            system = initialize_logging(log_dir=temp_dir, app_name="test_reinitialize",
+                                        enable_console=False)
+            gc.collect()
+
+            self.assertTrue(system.loggers["user"].handlers)
+            system.log_user_action(action="after_reinitialize")
+            system.shutdown()
+
+            with open(os.path.join(temp_dir, "test_reinitialize_user_actions.log"), encoding='utf-8') as f:
+                user_lines = [json.loads(line) for line in f if line.strip()]
+            self.assertEqual([line["message"] for line in user_lines], ["User action: after_reinitialize"])
+        finally:
+            logging_system._global_logging_system.shutdown()
+            logging_system._global_logging_system = previous
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_records_flushed_when_queue_drains(self):
+        """Test that buffered records are written once the listener is idle"""
+        temp_dir = tempfile.mkdtemp()
+        system = LoggingSystem(log_dir=temp_dir, app_name="test_queue_drain")
+        try:
+            for i in range(5):
+                system.log_user_action(action=f"drained_action_{i}")
+            
+            log_path = os.path.join(temp_dir, "test_queue_drain_user_actions.log")
+            deadline = time.time() + 5
+            lines = []
+            while time.time() < deadline:
+                with open(log_path, encoding='utf-8') as f:
+                    lines = [line for line in f if line.strip()]
+                if len(lines) == 5:
+                    break
+                time.sleep(0.01)
+            
+            self.assertEqual(len(lines), 5)
+        finally:
+            import shutil
+            system.shutdown()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
     def test_data_validation_logging(self):
         """Test data validation logging"""
         validation_type = "csv_structure"
@@ -239,6 +600,10 @@ class TestLoggingSystem(unittest.TestCase):
         self.assertEqual(stats["search"]["count"], 2)
         self.assertEqual(stats["search"]["success_count"], 1)
         self.assertEqual(stats["search"]["success_rate"], 0.5)
+        self.assertEqual(stats["search"]["min_duration"], 0.1)
+        self.assertEqual(stats["search"]["max_duration"], 0.15)
+        self.assertAlmostEqual(stats["search"]["total_duration"], 0.25)
+        self.assertAlmostEqual(stats["search"]["avg_duration"], 0.125)
         
         # Load_data operation should have 1 entry
         self.assertEqual(stats["load_data"]["count"], 1)
@@ -290,6 +655,28 @@ class TestLoggingSystem(unittest.TestCase):
         
         # Should be limited to 1000
         self.assertEqual(len(self.logging_system.performance_metrics), 1000)
+
+    def test_concurrent_performance_logging(self):
+        """Test that metrics logged from several threads are all recorded"""
+        import threading
+
+        def worker(worker_id):
+            for i in range(50):
+                self.logging_system.log_performance(
+                    operation=f"worker_{worker_id}",
+                    duration=0.01
+                )
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = self.logging_system.get_performance_summary(24)
+        self.assertEqual(summary["total_operations"], 200)
+        for n in range(4):
+            self.assertEqual(summary["operation_statistics"][f"worker_{n}"]["count"], 50)
     
     def test_config_changes_cleanup(self):
         """Test that old configuration changes are cleaned up"""
@@ -303,6 +690,27 @@ class TestLoggingSystem(unittest.TestCase):
         
         # Should be limited to 500
         self.assertEqual(len(self.logging_system.config_changes), 500)
+    
+    def test_cleanup_old_logs(self):
+        """Test that only log files older than the retention period are deleted"""
+        old_log = os.path.join(self.temp_dir, "old.log.1")
+        recent_log = os.path.join(self.temp_dir, "recent.log")
+        other_file = os.path.join(self.temp_dir, "notes.txt")
+        for path in (old_log, recent_log, other_file):
+            with open(path, 'w') as f:
+                f.write("data")
+        
+        old_mtime = time.time() - 40 * 24 * 3600
+        os.utime(old_log, (old_mtime, old_mtime))
+        os.utime(other_file, (old_mtime, old_mtime))
+        os.mkdir(os.path.join(self.temp_dir, "archive.logs"))
+        
+        self.logging_system.cleanup_old_logs(days=30)
+        
+        self.assertFalse(os.path.exists(old_log))
+        self.assertTrue(os.path.exists(recent_log))
+        self.assertTrue(os.path.exists(other_file))
+        self.assertTrue(os.path.isdir(os.path.join(self.temp_dir, "archive.logs")))
 
 
 class TestPerformanceMonitorDecorator(unittest.TestCase):
@@ -316,6 +724,7 @@ class TestPerformanceMonitorDecorator(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures"""
         import shutil
+        self.logging_system.shutdown()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_successful_operation_monitoring(self):